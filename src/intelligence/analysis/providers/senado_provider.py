@@ -3,12 +3,12 @@ Adaptador para a API do Senado Federal.
 """
 import re
 import logging
-import json
-import os
 from typing import Dict, List, Any, Optional
 
 from .base import LegislativeProvider
 from src.intelligence.collectors.senado import SenadoAPI
+from src.intelligence.collectors.senado.api_base import as_list
+from src.intelligence.collectors.senado.materias_collector import PL_URL_PREFIX
 
 # Configuração de logging
 logging.basicConfig(
@@ -28,11 +28,6 @@ class SenadoProvider(LegislativeProvider):
         Inicializa o adaptador com a API do Senado.
         """
         self.api = SenadoAPI()
-        
-        # Caminho para cache de API
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.abspath(os.path.join(script_dir, "../../../.."))
-        self.cache_dir = os.path.join(project_root, "data", "api_cache", "senado")
     
     def get_pl_details(self, pl_id_info: Dict[str, str]) -> Dict[str, Any]:
         """
@@ -85,29 +80,17 @@ class SenadoProvider(LegislativeProvider):
             Tupla (boolean indicando sucesso, dicionário com detalhes ou None)
         """
         try:
-            # Primeiro, tentar encontrar o arquivo de detalhes da matéria
-            materia_pattern = f"materia_{sigla}_{numero}_{ano}_*.json"
-            
-            import glob
-            materia_files = glob.glob(os.path.join(self.cache_dir, materia_pattern))
+            # Primeiro, buscar os detalhes da matéria no cache da API
+            materia_data = self.api.get_cached_response(f"materia/{sigla}/{numero}/{ano}")
             
-            if not materia_files:
-                return False, None
-            
-            # Usar o arquivo mais recente
-            materia_file = sorted(materia_files)[-1]
-            
-            with open(materia_file, 'r', encoding='utf-8') as f:
-                cached_data = json.load(f)
-            
-            if not cached_data or 'data' not in cached_data:
+            if not materia_data:
                 return False, None
             
             # Construir detalhes completos
             details = {}
             
             # Informações básicas da matéria
-            materia_data = cached_data['data']
+            codigo_materia = None
             if 'DetalheMateria' in materia_data:
                 materia = materia_data['DetalheMateria'].get('Materia', {})
                 
@@ -131,74 +114,59 @@ class SenadoProvider(LegislativeProvider):
                         "Palavras-chave": dados_basicos.get('IndexacaoMateria', '')
                     }
             
-            # Buscar situação atual
-            situacao_pattern = f"materia_situacaoatual_*.json"
-            situacao_files = glob.glob(os.path.join(self.cache_dir, situacao_pattern))
+            if not details:
+                return False, None
             
+            # Buscar situação atual
             situacao = {
                 "Local": "",
                 "Situacao": "",
                 "Data": ""
             }
             
-            if situacao_files:
-                situacao_file = sorted(situacao_files)[-1]
-                
-                with open(situacao_file, 'r', encoding='utf-8') as f:
-                    situacao_data = json.load(f)
+            situacao_data = self.api.get_cached_response(f"materia/situacaoatual/{codigo_materia}") if codigo_materia else None
+            
+            if situacao_data:
+                situacao_info = situacao_data.get('SituacaoAtualMateria', {}).get('Materia', {})
                 
-                if 'data' in situacao_data:
-                    situacao_info = situacao_data['data'].get('SituacaoAtualMateria', {}).get('Materia', {})
+                if situacao_info:
+                    local = situacao_info.get('Local', {}).get('NomeLocal', '')
+                    situacao_desc = situacao_info.get('Situacao', {}).get('DescricaoSituacao', '')
+                    data_situacao = situacao_info.get('Situacao', {}).get('DataSituacao', '')
+                    
+                    situacao = {
+                        "Local": local,
+                        "Situacao": situacao_desc,
+                        "Data": data_situacao
+                    }
                     
-                    if situacao_info:
-                        local = situacao_info.get('Local', {}).get('NomeLocal', '')
-                        situacao_desc = situacao_info.get('Situacao', {}).get('DescricaoSituacao', '')
-                        data_situacao = situacao_info.get('Situacao', {}).get('DataSituacao', '')
-                        
-                        situacao = {
-                            "Local": local,
-                            "Situacao": situacao_desc,
-                            "Data": data_situacao
-                        }
-                        
-                        # Atualizar status
-                        if local or situacao_desc:
-                            details["Status"] = f"{situacao_desc} - {local}" if situacao_desc and local else (situacao_desc or local or "Em tramitação")
+                    # Atualizar status
+                    if local or situacao_desc:
+                        details["Status"] = " - ".join(parte for parte in (situacao_desc, local) if parte)
             
             details["Situacao"] = situacao
             
             # Buscar tramitação
             try:
-                tramitacao_pattern = f"materia_movimentacoes_*.json"
-                tramitacao_files = glob.glob(os.path.join(self.cache_dir, tramitacao_pattern))
-                
                 tramitacao = []
                 
-                if tramitacao_files:
-                    tramitacao_file = sorted(tramitacao_files)[-1]
+                tramitacao_data = self.api.get_cached_response(f"materia/movimentacoes/{codigo_materia}") if codigo_materia else None
+                
+                if tramitacao_data:
+                    movimentacoes = as_list(tramitacao_data.get('MovimentacaoMateria', {}).get('Movimentacoes', {}).get('Movimentacao', []))
                     
-                    with open(tramitacao_file, 'r', encoding='utf-8') as f:
-                        tramitacao_data = json.load(f)
+                    # Processar cada evento
+                    for evento in movimentacoes:
+                        tramitacao.append({
+                            "Data": evento.get('DataMovimentacao', ''),
+                            "Local": evento.get('Local', {}).get('NomeLocal', ''),
+                            "SiglaLocal": evento.get('Local', {}).get('SiglaLocal', ''),
+                            "Situacao": evento.get('Situacao', {}).get('DescricaoSituacao', ''),
+                            "Texto": evento.get('TextoMovimentacao', '')
+                        })
                     
-                    if 'data' in tramitacao_data:
-                        movimentacoes = tramitacao_data['data'].get('MovimentacaoMateria', {}).get('Movimentacoes', {}).get('Movimentacao', [])
-                        
-                        # Garantir que seja uma lista
-                        if not isinstance(movimentacoes, list):
-                            movimentacoes = [movimentacoes]
-                        
-                        # Processar cada evento
-                        for evento in movimentacoes:
-                            tramitacao.append({
-                                "Data": evento.get('DataMovimentacao', ''),
-                                "Local": evento.get('Local', {}).get('NomeLocal', ''),
-                                "SiglaLocal": evento.get('Local', {}).get('SiglaLocal', ''),
-                                "Situacao": evento.get('Situacao', {}).get('DescricaoSituacao', ''),
-                                "Texto": evento.get('TextoMovimentacao', '')
-                            })
-                        
-                        # Ordenar por data (mais recente primeiro)
-                        tramitacao.sort(key=lambda x: x.get('Data', ''), reverse=True)
+                    # Ordenar por data (mais recente primeiro)
+                    tramitacao.sort(key=lambda x: x.get('Data', ''), reverse=True)
                 
                 details["Tramitacao_Detalhada"] = tramitacao
             except Exception as e:
@@ -206,36 +174,25 @@ class SenadoProvider(LegislativeProvider):
             
             # Buscar relatores
             try:
-                relatoria_pattern = f"materia_relatorias_*.json"
-                relatoria_files = glob.glob(os.path.join(self.cache_dir, relatoria_pattern))
-                
                 relatores = []
                 
-                if relatoria_files:
-                    relatoria_file = sorted(relatoria_files)[-1]
+                relatoria_data = self.api.get_cached_response(f"materia/relatorias/{codigo_materia}") if codigo_materia else None
+                
+                if relatoria_data:
+                    # Processar relatoria atual
+                    relatoria_atual = relatoria_data.get('RelatoriaMateria', {}).get('RelatoriaAtual', {})
+                    if relatoria_atual:
+                        relator = self._processar_relator(relatoria_atual.get('Relator', {}), "Atual")
+                        if relator:
+                            relatores.append(relator)
                     
-                    with open(relatoria_file, 'r', encoding='utf-8') as f:
-                        relatoria_data = json.load(f)
+                    # Processar relatorias encerradas
+                    relatorias_encerradas = as_list(relatoria_data.get('RelatoriaMateria', {}).get('RelatoriasEncerradas', {}).get('Relatoria', []))
                     
-                    if 'data' in relatoria_data:
-                        # Processar relatoria atual
-                        relatoria_atual = relatoria_data['data'].get('RelatoriaMateria', {}).get('RelatoriaAtual', {})
-                        if relatoria_atual:
-                            relator = self._processar_relator(relatoria_atual.get('Relator', {}), "Atual")
-                            if relator:
-                                relatores.append(relator)
-                        
-                        # Processar relatorias encerradas
-                        relatorias_encerradas = relatoria_data['data'].get('RelatoriaMateria', {}).get('RelatoriasEncerradas', {}).get('Relatoria', [])
-                        
-                        # Garantir que seja uma lista
-                        if not isinstance(relatorias_encerradas, list):
-                            relatorias_encerradas = [relatorias_encerradas]
-                        
-                        for relatoria in relatorias_encerradas:
-                            relator = self._processar_relator(relatoria.get('Relator', {}), "Encerrada")
-                            if relator:
-                                relatores.append(relator)
+                    for relatoria in relatorias_encerradas:
+                        relator = self._processar_relator(relatoria.get('Relator', {}), "Encerrada")
+                        if relator:
+                            relatores.append(relator)
                 
                 details["Relatores"] = relatores
             except Exception as e:
@@ -243,7 +200,7 @@ class SenadoProvider(LegislativeProvider):
             
             # Adicionar detalhes adicionais
             details["detalhes_adicionais"] = {
-                "autoria_detalhada": self._extract_autoria_detalhada(materia_data)
+                "autoria_detalhada": self._extract_autoria_detalhada(materia)
             }
             
             return True, details
@@ -298,16 +255,17 @@ class SenadoProvider(LegislativeProvider):
                 resultado["UF"] = ""
             
             return resultado
-        except Exception as e:
-            logger.error(f"Erro ao processar dados do relator: {str(e)}")
+        except (AttributeError, TypeError) as e:
+            # Nó com formato inesperado (ex.: texto ou None no lugar de um dicionário)
+            logger.error("Erro ao processar dados do relator: %s", e)
             return None
     
-    def _extract_autoria_detalhada(self, materia_data: Dict) -> List[Dict[str, Any]]:
+    def _extract_autoria_detalhada(self, materia: Dict) -> List[Dict[str, Any]]:
         """
         Extrai detalhes de autoria da matéria.
         
         Args:
-            materia_data: Dados da matéria
+            materia: Nó Materia do detalhe da matéria, já extraído pelo chamador
             
         Returns:
             Lista de autores com detalhes
@@ -316,21 +274,12 @@ class SenadoProvider(LegislativeProvider):
         
         try:
             # Verificar se há dados de autoria
-            if 'DetalheMateria' in materia_data:
-                materia = materia_data['DetalheMateria'].get('Materia', {})
-                
-                if not materia:
-                    return autores
-                
+            if materia:
                 autoria = materia.get('Autoria', {})
                 if not autoria:
                     return autores
                 
-                autor_data = autoria.get('Autor', [])
-                
-                # Garantir que seja uma lista
-                if not isinstance(autor_data, list):
-                    autor_data = [autor_data]
+                autor_data = as_list(autoria.get('Autor', []))
                 
                 for autor in autor_data:
                     nome = autor.get('NomeAutor', '')
@@ -400,11 +349,7 @@ class SenadoProvider(LegislativeProvider):
             # Se não tiver lá, tentar na Autoria
             autoria = materia.get('Autoria', {})
             if isinstance(autoria, dict):
-                autores = autoria.get('Autor', [])
-                
-                # Garantir que seja uma lista
-                if not isinstance(autores, list):
-                    autores = [autores]
+                autores = as_list(autoria.get('Autor', []))
                 
                 # Extrair nomes dos autores
                 nomes_autores = []
@@ -417,11 +362,12 @@ class SenadoProvider(LegislativeProvider):
                 return ", ".join(nomes_autores) if nomes_autores else "Não informado"
             
             return "Não informado"
-        except Exception as e:
-            logger.error(f"Erro ao extrair autor: {str(e)}")
+        except (AttributeError, TypeError) as e:
+            logger.error("Erro ao extrair autor: %s", e)
             return "Não informado"
     
-    def _build_pl_url(self, sigla: str, numero: str, ano: str, codigo_materia: str = None) -> str:
+    @staticmethod
+    def _build_pl_url(sigla: str, numero: str, ano: str, codigo_materia: str = None) -> str:
         """
         Constrói a URL para acessar o PL no site do Senado.
         
@@ -435,9 +381,9 @@ class SenadoProvider(LegislativeProvider):
             URL para acessar o PL
         """
         if codigo_materia:
-            return f"https://www25.senado.leg.br/web/atividade/materias/-/materia/{codigo_materia}"
+            return PL_URL_PREFIX + str(codigo_materia)
         else:
-            return f"https://www25.senado.leg.br/web/atividade/materias/-/materia/busca?b_pesquisaMaterias=proposicao_{sigla}_{numero}_{ano}"
+            return f"{PL_URL_PREFIX}busca?b_pesquisaMaterias=proposicao_{sigla}_{numero}_{ano}"
     
     def search_pls(self, criteria: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -5,11 +5,25 @@ Cliente base para a API do Senado com funções de cache e requisições HTTP.
 import os
 import requests
 import json
+import zlib
+import sqlite3
+import hashlib
 import logging
+import threading
+import time
 import xmltodict
-from datetime import datetime
+from collections import OrderedDict
+from urllib.parse import urlencode
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, List, Any, Optional, Tuple
 
+# orjson é opcional: quando disponível, acelera a (de)serialização do cache
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configuração de logging
 logging.basicConfig(
     level=logging.INFO,
@@ -17,37 +31,114 @@ logging.basicConfig(
 )
 logger = logging.getLogger("senado_api_base")
 
+# Elementos repetíveis do XML do Senado que são sempre convertidos em lista, mesmo
+# quando a resposta traz um único item. Nomes ambíguos (ex.: Materia, Autor) ficam de
+# fora, pois em outros endpoints aparecem como nó único e são lidos como dicionário.
+XML_LIST_NODES = (
+    "Movimentacao", "Atualizacao", "Relatoria", "Votacao", "VotoParlamentar", "Emenda"
+)
+
+# Tamanho máximo (em bytes comprimidos) dos dados mantidos no banco de cache
+CACHE_SIZE_LIMIT = 512 * 1024 * 1024
+
+# Número máximo de respostas mantidas no cache em memória de cada cliente
+MEMORY_CACHE_SIZE = 256
+
+
+def as_list(value: Any) -> List[Any]:
+    """
+    Normaliza um nó do XML convertido que pode vir como item único, lista ou vazio.
+    
+    Args:
+        value: Valor retornado pelo xmltodict
+        
+    Returns:
+        Lista com os itens (vazia se o nó não existir)
+    """
+    if type(value) is list:
+        return value
+    return [] if value is None else [value]
+
+
+def _serialize_cache_data(data: Any) -> bytes:
+    """Serializa dados em JSON compacto (sem compressão), como mantidos em memória."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _deserialize_cache_data(raw: bytes) -> Any:
+    """Desserializa dados em JSON, devolvendo sempre um objeto novo."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 class SenadoAPIBase:
     """Cliente base com funcionalidades comuns: cache, requisições HTTP"""
     BASE_URL = "https://legis.senado.leg.br/dadosabertos"
     
-    def __init__(self, cache_dir: str = None):
+    def __init__(self, cache_dir: str = None, shared: Optional["SenadoAPIBase"] = None):
         """
         Inicializa o cliente base da API do Senado.
         
         Args:
             cache_dir: Diretório para cache de respostas. Se None, usa o padrão.
+            shared: Cliente já inicializado cuja sessão HTTP e cache devem ser
+                reutilizados, em vez de abrir novos
         """
-        # Definir diretório de cache
-        if cache_dir is None:
-            self.cache_dir = os.path.join(os.getcwd(), "data", "api_cache", "senado")
+        if shared is not None:
+            # Mesmo pool de conexões, banco de cache e cache em memória
+            self.cache_dir = shared.cache_dir
+            self.session = shared.session
+            self._cache_db = shared._cache_db
+            self._cache_lock = shared._cache_lock
+            self._mem_cache = shared._mem_cache
         else:
-            self.cache_dir = cache_dir
-        
-        # Garantir que o diretório existe
-        os.makedirs(self.cache_dir, exist_ok=True)
-        
-        # Configuração do cliente
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "Regulatory Suite/0.1 (Analise de Impacto Regulatorio)"
-        })
+            # Definir diretório de cache
+            if cache_dir is None:
+                self.cache_dir = os.path.join(os.getcwd(), "data", "api_cache", "senado")
+            else:
+                self.cache_dir = cache_dir
+            
+            # Garantir que o diretório existe
+            os.makedirs(self.cache_dir, exist_ok=True)
+            
+            # Abrir o banco de cache (SQLite em modo WAL)
+            self._init_cache_db()
+            
+            # Configuração do cliente
+            self.session = requests.Session()
+            self.session.headers.update({
+                "User-Agent": "Regulatory Suite/0.1 (Analise de Impacto Regulatorio)",
+                "Accept-Encoding": "gzip, deflate",
+                "Connection": "keep-alive"
+            })
+            
+            # Pool de conexões maior e novas tentativas para erros transitórios do servidor
+            adapter = HTTPAdapter(
+                pool_connections=20,
+                pool_maxsize=50,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=["GET"]
+                )
+            )
+            # Também em http://: links de textos integrais podem não usar https
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
         
         # Flag para controle de uso de cache
         self.use_cache = True
         
         # Tempo de expiração do cache em segundos (12 horas)
         self.cache_expiration = 12 * 60 * 60
+        
+        # Descartar entradas vencidas (e o excesso de tamanho) uma vez, ao abrir o banco
+        if shared is None:
+            self._purge_expired_cache()
     
     def set_cache_policy(self, use_cache: bool, expiration_hours: int = 12):
         """
@@ -62,25 +153,111 @@ class SenadoAPIBase:
         logger.info(f"Política de cache definida: {'usar cache' if use_cache else 'não usar cache'}, "
                    f"expiração em {expiration_hours} horas")
     
-    def _get_cache_path(self, endpoint: str, params: Dict) -> str:
+    def _init_cache_db(self):
         """
-        Retorna o caminho para um arquivo de cache específico.
+        Abre (ou cria) o banco SQLite que armazena o cache de respostas.
+        
+        Um único arquivo com journal WAL substitui um JSON por requisição: a busca
+        é feita pelo índice da chave primária e as escritas são transacionais.
+        """
+        db_path = os.path.join(self.cache_dir, "cache.sqlite")
+        self._cache_db = sqlite3.connect(
+            db_path, isolation_level=None, check_same_thread=False, timeout=30
+        )
+        self._cache_db.execute("PRAGMA journal_mode=WAL")
+        self._cache_db.execute("PRAGMA synchronous=NORMAL")
+        self._cache_db.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, ts REAL NOT NULL, data BLOB NOT NULL, "
+            "etag TEXT, last_modified TEXT)"
+        )
+        
+        # Bancos criados antes dos validadores HTTP não têm as colunas etag/last_modified
+        colunas = {row[1] for row in self._cache_db.execute("PRAGMA table_info(cache)")}
+        for coluna in ("etag", "last_modified"):
+            if coluna not in colunas:
+                self._cache_db.execute(f"ALTER TABLE cache ADD COLUMN {coluna} TEXT")
+        
+        # A conexão é compartilhada entre as threads do coletor
+        self._cache_lock = threading.Lock()
+        
+        # Cache LRU em memória na frente do SQLite: (timestamp, JSON serializado) por
+        # chave. Guardar os bytes, e não o objeto, faz cada acesso devolver uma cópia
+        # própria; sem compressão, um acesso custa só a desserialização
+        self._mem_cache = OrderedDict()
+    
+    def _purge_expired_cache(self):
+        """
+        Remove do banco as entradas de cache já expiradas e, se o total ainda
+        exceder CACHE_SIZE_LIMIT, descarta as entradas mais antigas.
+        
+        A expiração é decidida pela coluna de timestamp, sem ler nem descomprimir
+        os dados; a limpeza só evita que o arquivo cresça com entradas inúteis.
+        Entradas expiradas com ETag/Last-Modified são mantidas para revalidação
+        (ficam sujeitas apenas ao limite de tamanho).
+        """
+        try:
+            with self._cache_lock:
+                removed = self._cache_db.execute(
+                    "DELETE FROM cache WHERE ts <= ? AND etag IS NULL AND last_modified IS NULL",
+                    (time.time() - self.cache_expiration,)
+                ).rowcount
+                
+                # Manter as entradas mais recentes até o limite de tamanho
+                evicted = self._cache_db.execute(
+                    """
+                    DELETE FROM cache WHERE key IN (
+                        SELECT key FROM (
+                            SELECT key, SUM(length(data)) OVER (ORDER BY ts DESC) AS acumulado
+                            FROM cache
+                        ) WHERE acumulado > ?
+                    )
+                    """,
+                    (CACHE_SIZE_LIMIT,)
+                ).rowcount
+            if removed:
+                logger.info(f"{removed} entradas expiradas removidas do cache")
+            if evicted:
+                logger.info(f"{evicted} entradas antigas removidas do cache (limite de tamanho)")
+        except Exception as e:
+            logger.error(f"Erro ao limpar entradas do cache: {str(e)}")
+    
+    def _mem_cache_get(self, key: str, min_time: float) -> Optional[bytes]:
+        """Retorna os dados serializados do cache em memória, se presentes e não expirados."""
+        with self._cache_lock:
+            entry = self._mem_cache.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= min_time:
+                del self._mem_cache[key]
+                return None
+            self._mem_cache.move_to_end(key)
+            return entry[1]
+    
+    def _mem_cache_put(self, key: str, ts: float, raw: bytes):
+        """Insere dados serializados no cache em memória, descartando os menos usados."""
+        with self._cache_lock:
+            self._mem_cache[key] = (ts, raw)
+            self._mem_cache.move_to_end(key)
+            while len(self._mem_cache) > MEMORY_CACHE_SIZE:
+                self._mem_cache.popitem(last=False)
+    
+    def _get_cache_key(self, endpoint: str, params: Dict) -> str:
+        """
+        Retorna a chave do cache para uma requisição.
         
         Args:
             endpoint: Endpoint da API
             params: Parâmetros da requisição
             
         Returns:
-            Caminho completo para o arquivo de cache
+            Chave única no formato "endpoint?hash_dos_parametros"
         """
-        # Criar uma chave única para o cache
-        params_str = json.dumps(params, sort_keys=True)
-        import hashlib
-        params_hash = hashlib.md5(params_str.encode()).hexdigest()
+        # Criar uma chave única para o cache a partir dos parâmetros ordenados; a
+        # codificação de URL escapa "=" e "&" nos valores, evitando colisões entre
+        # conjuntos de parâmetros diferentes
+        encoded = urlencode(sorted(params.items())).encode()
         
-        # Criar nome do arquivo sanitizado
-        safe_endpoint = endpoint.replace('/', '_').replace('\\', '_')
-        return os.path.join(self.cache_dir, f"{safe_endpoint}_{params_hash}.json")
+        return f"{endpoint}?{hashlib.blake2b(encoded, digest_size=16).hexdigest()}"
     
     def _load_from_cache(self, endpoint: str, params: Dict) -> Optional[Dict]:
         """
@@ -96,28 +273,34 @@ class SenadoAPIBase:
         if not self.use_cache:
             return None
         
-        cache_path = self._get_cache_path(endpoint, params)
+        key = self._get_cache_key(endpoint, params)
         
-        if os.path.exists(cache_path):
-            try:
-                with open(cache_path, 'r', encoding='utf-8') as f:
-                    cached_data = json.load(f)
-                
-                # Verificar se o cache expirou
-                cache_time = cached_data.get('_cache_time', 0)
-                now = datetime.now().timestamp()
-                
-                if now - cache_time <= self.cache_expiration:
-                    logger.info(f"Dados carregados do cache para {endpoint}")
-                    return cached_data.get('data')
-                else:
-                    logger.info(f"Cache expirado para {endpoint}")
-            except Exception as e:
-                logger.error(f"Erro ao carregar do cache para {endpoint}: {str(e)}")
+        min_time = time.time() - self.cache_expiration
+        
+        # Respostas já usadas nesta execução dispensam a leitura do disco e a descompressão
+        raw = self._mem_cache_get(key, min_time)
+        if raw is not None:
+            return _deserialize_cache_data(raw)
+        
+        try:
+            # Entradas expiradas são descartadas pela própria consulta
+            with self._cache_lock:
+                row = self._cache_db.execute(
+                    "SELECT ts, data FROM cache WHERE key = ? AND ts > ?", (key, min_time)
+                ).fetchone()
+            
+            if row is not None:
+                logger.info(f"Dados carregados do cache para {endpoint}")
+                raw = zlib.decompress(row[1])
+                self._mem_cache_put(key, row[0], raw)
+                return _deserialize_cache_data(raw)
+        except Exception as e:
+            logger.error(f"Erro ao carregar do cache para {endpoint}: {str(e)}")
         
         return None
     
-    def _save_to_cache(self, endpoint: str, params: Dict, data: Dict) -> bool:
+    def _save_to_cache(self, endpoint: str, params: Dict, data: Dict,
+                       etag: str = None, last_modified: str = None) -> bool:
         """
         Salva dados no cache.
         
@@ -125,6 +308,8 @@ class SenadoAPIBase:
             endpoint: Endpoint da API
             params: Parâmetros da requisição
             data: Dados a serem salvos
+            etag: Cabeçalho ETag da resposta, para revalidação condicional
+            last_modified: Cabeçalho Last-Modified da resposta, para revalidação condicional
             
         Returns:
             True se salvou com sucesso, False caso contrário
@@ -132,17 +317,21 @@ class SenadoAPIBase:
         if not self.use_cache:
             return False
         
-        cache_path = self._get_cache_path(endpoint, params)
+        key = self._get_cache_key(endpoint, params)
         
         try:
-            # Adicionar timestamp para expiração
-            cache_data = {
-                '_cache_time': datetime.now().timestamp(),
-                'data': data
-            }
+            # JSON compacto e comprimido; o timestamp fica em coluna própria
+            raw = _serialize_cache_data(data)
+            blob = zlib.compress(raw, 1)
+            ts = time.time()
+            
+            with self._cache_lock:
+                self._cache_db.execute(
+                    "INSERT OR REPLACE INTO cache (key, ts, data, etag, last_modified) VALUES (?, ?, ?, ?, ?)",
+                    (key, ts, blob, etag, last_modified)
+                )
             
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=4)
+            self._mem_cache_put(key, ts, raw)
             
             logger.info(f"Dados salvos no cache para {endpoint}")
             return True
@@ -150,13 +339,76 @@ class SenadoAPIBase:
             logger.error(f"Erro ao salvar no cache para {endpoint}: {str(e)}")
             return False
     
-    def _make_request(self, endpoint: str, params: Dict = None) -> Tuple[Dict, bool]:
+    def _get_cache_validators(self, endpoint: str, params: Dict) -> Dict[str, str]:
+        """
+        Retorna os cabeçalhos condicionais para revalidar uma entrada expirada do cache.
+        
+        Args:
+            endpoint: Endpoint da API
+            params: Parâmetros da requisição
+            
+        Returns:
+            Dicionário com If-None-Match/If-Modified-Since (vazio se não houver validadores)
+        """
+        if not self.use_cache:
+            return {}
+        
+        key = self._get_cache_key(endpoint, params)
+        try:
+            with self._cache_lock:
+                row = self._cache_db.execute(
+                    "SELECT etag, last_modified FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+        except Exception as e:
+            logger.error(f"Erro ao consultar validadores do cache para {endpoint}: {str(e)}")
+            return {}
+        
+        headers = {}
+        if row is not None:
+            if row[0]:
+                headers["If-None-Match"] = row[0]
+            if row[1]:
+                headers["If-Modified-Since"] = row[1]
+        return headers
+    
+    def _revalidate_cache(self, endpoint: str, params: Dict) -> Optional[Dict]:
+        """
+        Renova uma entrada do cache após resposta 304 (Not Modified) e retorna seus dados.
+        
+        Args:
+            endpoint: Endpoint da API
+            params: Parâmetros da requisição
+            
+        Returns:
+            Dados do cache ou None se a entrada não estiver mais disponível
+        """
+        key = self._get_cache_key(endpoint, params)
+        ts = time.time()
+        try:
+            with self._cache_lock:
+                self._cache_db.execute("UPDATE cache SET ts = ? WHERE key = ?", (ts, key))
+                row = self._cache_db.execute(
+                    "SELECT data FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+            
+            if row is not None:
+                logger.info(f"Cache revalidado (304) para {endpoint}")
+                raw = zlib.decompress(row[0])
+                self._mem_cache_put(key, ts, raw)
+                return _deserialize_cache_data(raw)
+        except Exception as e:
+            logger.error(f"Erro ao revalidar o cache para {endpoint}: {str(e)}")
+        
+        return None
+    
+    def _make_request(self, endpoint: str, params: Dict = None, conditional: bool = True) -> Tuple[Dict, bool]:
         """
         Faz uma requisição à API do Senado, com suporte a cache.
         
         Args:
             endpoint: Endpoint da API
             params: Parâmetros da requisição
+            conditional: Se True, revalida entradas expiradas do cache com ETag/Last-Modified
             
         Returns:
             Tupla (dados da resposta, booleano indicando se veio do cache)
@@ -172,32 +424,61 @@ class SenadoAPIBase:
         # Construir URL
         url = f"{self.BASE_URL}/{endpoint}"
         
+        # Se houver uma entrada expirada com ETag/Last-Modified, pedir só o que mudou
+        conditional_headers = self._get_cache_validators(endpoint, params) if conditional else {}
+        
         try:
-            # Fazer requisição
-            response = self.session.get(url, params=params, timeout=30)
-            
-            # Verificar resposta
-            if response.status_code == 200:
-                try:
-                    # Verificar se é XML (o formato padrão da API do Senado)
-                    if 'xml' in response.headers.get('Content-Type', '').lower():
-                        # Converter XML para dicionário
-                        data = xmltodict.parse(response.content)
-                    else:
-                        # Tentar como JSON
-                        data = response.json()
-                    
-                    # Salvar no cache
-                    self._save_to_cache(endpoint, params, data)
-                    
-                    return data, False
-                except Exception as e:
-                    logger.error(f"Erro ao processar resposta para {endpoint}: {str(e)}")
-                    logger.debug(f"Conteúdo da resposta: {response.text[:500]}...")
+            # Fazer requisição em modo streaming, para que o XML seja processado
+            # à medida que chega em vez de ser carregado inteiro na memória
+            with self.session.get(url, params=params, headers=conditional_headers,
+                                  timeout=30, stream=True) as response:
+                # Conteúdo inalterado: reaproveitar a entrada expirada do cache
+                if response.status_code == 304 and conditional_headers:
+                    data = self._revalidate_cache(endpoint, params)
+                    if data is not None:
+                        return data, True
+                    # Entrada removida entre a consulta e a resposta: buscar de novo
+                    return self._make_request(endpoint, params, conditional=False)
+                
+                # Verificar resposta
+                if response.status_code == 200:
+                    content_type = response.headers.get('Content-Type', '').lower()
+                    try:
+                        # Verificar se é XML (o formato padrão da API do Senado)
+                        if 'xml' in content_type:
+                            # Converter XML para dicionário direto do socket (descompactando gzip).
+                            # Atributos (xmlns, schemaLocation) não são usados pelos coletores
+                            # e geram um dicionário extra por elemento, por isso são ignorados
+                            response.raw.decode_content = True
+                            data = xmltodict.parse(
+                                response.raw,
+                                disable_entities=True,
+                                xml_attribs=False,
+                                force_list=XML_LIST_NODES
+                            )
+                        elif orjson is not None:
+                            # Tentar como JSON, direto dos bytes
+                            data = orjson.loads(response.content)
+                        else:
+                            # Tentar como JSON
+                            data = response.json()
+                        
+                        # Salvar no cache, com os validadores para revalidação futura
+                        self._save_to_cache(
+                            endpoint, params, data,
+                            etag=response.headers.get('ETag'),
+                            last_modified=response.headers.get('Last-Modified')
+                        )
+                        
+                        return data, False
+                    except Exception as e:
+                        logger.error(f"Erro ao processar resposta para {endpoint}: {str(e)}")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"Conteúdo da resposta: {self._peek_body(response)}...")
+                        return {}, False
+                else:
+                    logger.error(f"Erro {response.status_code} ao acessar {endpoint}: {self._peek_body(response)}")
                     return {}, False
-            else:
-                logger.error(f"Erro {response.status_code} ao acessar {endpoint}: {response.text}")
-                return {}, False
         except requests.exceptions.Timeout:
             logger.error(f"Timeout ao acessar {endpoint}")
             return {}, False
@@ -205,6 +486,24 @@ class SenadoAPIBase:
             logger.error(f"Erro ao fazer requisição para {endpoint}: {str(e)}")
             return {}, False
     
+    @staticmethod
+    def _peek_body(response: requests.Response, size: int = 512) -> str:
+        """
+        Lê apenas o início do corpo de uma resposta em streaming, para fins de log.
+        
+        Args:
+            response: Resposta obtida com stream=True
+            size: Número máximo de bytes a ler
+            
+        Returns:
+            Trecho do corpo decodificado ou string vazia se não for possível lê-lo
+        """
+        try:
+            response.raw.decode_content = True
+            return response.raw.read(size).decode(response.encoding or 'utf-8', errors='replace')
+        except Exception:
+            return ''
+    
     def _extract_codigo_materia(self, sigla: str, numero: str, ano: str) -> Optional[str]:
         """
         Extrai o código da matéria a partir de sigla, número e ano.
@@ -221,12 +520,8 @@ class SenadoAPIBase:
         endpoint = f"materia/{sigla}/{numero}/{ano}"
         
         # Fazer requisição
-        detalhes, from_cache = self._make_request(endpoint)
+        detalhes, _ = self._make_request(endpoint)
         
-        if detalhes:
-            try:
-                return detalhes.get('DetalheMateria', {}).get('Materia', {}).get('IdentificacaoMateria', {}).get('CodigoMateria')
-            except Exception as e:
-                logger.error(f"Erro ao extrair código da matéria: {str(e)}")
-        
-        return None
+        # Cada nível pode faltar ou vir vazio (None) no XML convertido
+        materia = (detalhes.get('DetalheMateria') or {}).get('Materia') or {}
+        return (materia.get('IdentificacaoMateria') or {}).get('CodigoMateria')
@@ -3,9 +3,10 @@
 Coletor especializado em autoria de PLs.
 """
 import logging
+import re
 from typing import Dict, List, Any, Optional
 
-from .api_base import SenadoAPIBase
+from .api_base import SenadoAPIBase, as_list
 
 # Configuração de logging
 logger = logging.getLogger("senado_autoria_collector")
@@ -29,38 +30,30 @@ class AutoriaCollector(SenadoAPIBase):
         endpoint = f"materia/autoria/{codigo_materia}"
         
         # Fazer requisição
-        data, from_cache = self._make_request(endpoint)
+        data, _ = self._make_request(endpoint)
         
         if not data:
             logger.warning(f"Autoria não encontrada para matéria {codigo_materia}")
             return []
         
         # Processar autores
-        if not from_cache:
-            try:
-                # Extrair dados de autoria
-                autoria = data.get('AutoriaMateria', {}).get('Autores', {}).get('Autor', [])
-                
-                # Garantir que seja uma lista
-                if not isinstance(autoria, list):
-                    autoria = [autoria]
-                
-                # Processar cada autor
-                resultado = []
-                for autor in autoria:
-                    autor_processado = self._processar_autor(autor)
-                    if autor_processado:
-                        resultado.append(autor_processado)
-                
-                logger.info(f"Encontrados {len(resultado)} autores para matéria {codigo_materia}")
-                return resultado
-            except Exception as e:
-                logger.error(f"Erro ao processar autoria da matéria {codigo_materia}: {str(e)}")
-                return []
-        else:
-            # Se veio do cache, retorna diretamente
-            return data
-    
+        try:
+            # Extrair dados de autoria
+            autoria = as_list(data.get('AutoriaMateria', {}).get('Autores', {}).get('Autor', []))
+            
+            # Processar cada autor
+            resultado = []
+            for autor in autoria:
+                autor_processado = self._processar_autor(autor)
+                if autor_processado:
+                    resultado.append(autor_processado)
+            
+            logger.info(f"Encontrados {len(resultado)} autores para matéria {codigo_materia}")
+            return resultado
+        except Exception as e:
+            logger.error(f"Erro ao processar autoria da matéria {codigo_materia}: {str(e)}")
+            return []
+        
     def _processar_autor(self, autor_data: Dict) -> Optional[Dict[str, Any]]:
         """
         Processa dados de um autor.
@@ -109,7 +102,6 @@ class AutoriaCollector(SenadoAPIBase):
             
             # Para parlamentares, tentar extrair partido/UF do nome
             if tipo_autor == "Parlamentar":
-                import re
                 partido_uf_match = re.search(r'\(([A-Z]+)[\/\-]([A-Z]{2})\)', nome)
                 if partido_uf_match:
                     partido = partido_uf_match.group(1)
@@ -147,7 +139,7 @@ class AutoriaCollector(SenadoAPIBase):
                 "primeiro_autor": autor_data.get('IndicadorAutorPrincipal', 'Não') == 'Sim'
             }
         except Exception as e:
-            logger.error(f"Erro ao processar dados do autor: {str(e)}")
+            logger.error("Erro ao processar dados do autor: %s", e)
             return None
     
     def get_autor_principal(self, codigo_materia: str) -> Optional[Dict[str, Any]]:
@@ -8,11 +8,69 @@ import pandas as pd
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
-from .api_base import SenadoAPIBase
+from .api_base import SenadoAPIBase, as_list
 
 # Configuração de logging
 logger = logging.getLogger("senado_materias_collector")
 
+# Colunas das linhas de PL produzidas pela pesquisa
+PL_ROW_FIELDS = (
+    "ID", "Sigla", "Numero", "Ano", "CodigoMateria", "Título", "Data",
+    "Autor", "Status", "URL", "Palavras-chave"
+)
+
+# Prefixo das páginas de matérias no portal do Senado
+PL_URL_PREFIX = "https://www25.senado.leg.br/web/atividade/materias/-/materia/"
+
+# Dicionário vazio compartilhado, usado como padrão ao percorrer nós ausentes.
+# Nunca deve ser modificado.
+_EMPTY: Dict = {}
+
+
+def _dig(data: Optional[Dict], *keys: str) -> Any:
+    """
+    Percorre dicionários aninhados, tolerando nós vazios (None) do XML.
+    
+    Args:
+        data: Dicionário inicial
+        keys: Sequência de chaves a percorrer
+        
+    Returns:
+        Valor encontrado ou string vazia se algum nível estiver ausente
+    """
+    for key in keys:
+        if not data:
+            return ''
+        data = data.get(key)
+    return data or ''
+
+
+def _extract_autor(materia: Dict) -> str:
+    """
+    Extrai o nome do autor de uma matéria detalhada.
+    
+    Args:
+        materia: Dados da matéria
+        
+    Returns:
+        Nome do autor, ou os nomes separados por vírgula se houver mais de um
+    """
+    # Primeiro, tentar pegar do DadosBasicosMateria
+    autor_basico = _dig(materia, 'DadosBasicosMateria', 'NomeAutor')
+    if autor_basico:
+        return autor_basico
+    
+    # Se não tiver lá, tentar na Autoria
+    autoria = materia.get('Autoria')
+    if not isinstance(autoria, dict):
+        return "Não informado"
+    
+    nomes_autores = [
+        autor['NomeAutor'] for autor in as_list(autoria.get('Autor'))
+        if type(autor) is dict and autor.get('NomeAutor')
+    ]
+    return ", ".join(nomes_autores) if nomes_autores else "Não informado"
+
 class MateriasCollector(SenadoAPIBase):
     """Especializado em buscar PLs e suas informações básicas"""
     
@@ -34,82 +92,80 @@ class MateriasCollector(SenadoAPIBase):
         endpoint = f"materia/{sigla}/{numero}/{ano}"
         
         # Fazer requisição
-        data, from_cache = self._make_request(endpoint)
+        data, _ = self._make_request(endpoint)
         
         if not data:
             logger.warning(f"PL {sigla} {numero}/{ano} não encontrado na API do Senado")
             return {}
         
         # Se não veio do cache, processa os dados brutos
-        if not from_cache:
-            try:
-                # Processar resposta
-                materia = data.get('DetalheMateria', {}).get('Materia', {})
-                
-                if not materia:
-                    logger.warning(f"PL {sigla} {numero}/{ano} não encontrado na API do Senado")
-                    return {}
-                
-                # Extrair código da matéria (para buscar situação atual)
-                codigo_materia = materia.get('IdentificacaoMateria', {}).get('CodigoMateria')
-                
-                # Dados básicos
-                processed_data = {
-                    "Título": materia.get('DadosBasicosMateria', {}).get('EmentaMateria', ''),
-                    "Data": materia.get('DadosBasicosMateria', {}).get('DataApresentacao', ''),
-                    "Autor": self._extract_autor(materia),
-                    "Status": "Em tramitação",  # Será atualizado com dados da situação atual
-                    "URL": self._build_pl_url(sigla, numero, ano, codigo_materia),
-                    "Palavras-chave": materia.get('DadosBasicosMateria', {}).get('IndexacaoMateria', ''),
-                    "Situacao": {
-                        "Local": "",
-                        "Situacao": "",
-                        "Data": ""
-                    },
-                    "Tramitacao": []
-                }
+        try:
+            # Processar resposta
+            materia = (data.get('DetalheMateria') or _EMPTY).get('Materia') or _EMPTY
+            
+            if not materia:
+                logger.warning(f"PL {sigla} {numero}/{ano} não encontrado na API do Senado")
+                return {}
+            
+            # Extrair código da matéria (para buscar situação atual)
+            codigo_materia = (materia.get('IdentificacaoMateria') or _EMPTY).get('CodigoMateria')
+            
+            # Dados básicos (subárvore percorrida uma única vez)
+            dados_basicos = materia.get('DadosBasicosMateria') or _EMPTY
+            processed_data = {
+                "Título": dados_basicos.get('EmentaMateria', ''),
+                "Data": dados_basicos.get('DataApresentacao', ''),
+                "Autor": _extract_autor(materia),
+                "Status": "Em tramitação",  # Será atualizado com dados da situação atual
+                "URL": self._build_pl_url(sigla, numero, ano, codigo_materia),
+                "Palavras-chave": dados_basicos.get('IndexacaoMateria', ''),
+                "Situacao": {
+                    "Local": "",
+                    "Situacao": "",
+                    "Data": ""
+                },
+                "Tramitacao": []
+            }
+            
+            # Se temos o código da matéria, buscar situação atual (mais confiável)
+            if codigo_materia:
+                situacao_endpoint = f"materia/situacaoatual/{codigo_materia}"
+                situacao_data, _ = self._make_request(situacao_endpoint)
                 
-                # Se temos o código da matéria, buscar situação atual (mais confiável)
-                if codigo_materia:
-                    situacao_endpoint = f"materia/situacaoatual/{codigo_materia}"
-                    situacao_data, situacao_from_cache = self._make_request(situacao_endpoint)
-                    
-                    if situacao_data:
-                        try:
-                            situacao = situacao_data.get('SituacaoAtualMateria', {}).get('Materia', {})
+                if situacao_data:
+                    try:
+                        situacao = (situacao_data.get('SituacaoAtualMateria') or _EMPTY).get('Materia')
+                        
+                        if situacao:
+                            # Atualizar status e situação
+                            situacao_info = situacao.get('Situacao') or _EMPTY
+                            local = (situacao.get('Local') or _EMPTY).get('NomeLocal', '')
+                            situacao_desc = situacao_info.get('DescricaoSituacao', '')
+                            data_situacao = situacao_info.get('DataSituacao', '')
                             
-                            if situacao:
-                                # Atualizar status e situação
-                                local = situacao.get('Local', {}).get('NomeLocal', '')
-                                situacao_desc = situacao.get('Situacao', {}).get('DescricaoSituacao', '')
-                                data_situacao = situacao.get('Situacao', {}).get('DataSituacao', '')
-                                
-                                # Atualizar com dados mais precisos
-                                if local or situacao_desc:
-                                    processed_data["Status"] = f"{situacao_desc} - {local}" if situacao_desc and local else (situacao_desc or local or "Em tramitação")
-                                
-                                processed_data["Situacao"] = {
-                                    "Local": local,
-                                    "Situacao": situacao_desc,
-                                    "Data": data_situacao
-                                }
-                        except Exception as e:
-                            logger.error(f"Erro ao processar situação atual do PL {sigla} {numero}/{ano}: {str(e)}")
-                
-                # Adicionar o código da matéria para uso futuro
-                processed_data["CodigoMateria"] = codigo_materia
-                processed_data["Sigla"] = sigla
-                processed_data["Numero"] = numero
-                processed_data["Ano"] = ano
-                
-                return processed_data
-            except Exception as e:
-                logger.error(f"Erro ao processar dados do PL {sigla} {numero}/{ano}: {str(e)}")
-                return {}
-        else:
-            # Se veio do cache, retorna diretamente
-            return data
-    
+                            # Atualizar com dados mais precisos
+                            if local or situacao_desc:
+                                processed_data["Status"] = " - ".join(parte for parte in (situacao_desc, local) if parte)
+                            
+                            processed_data["Situacao"] = {
+                                "Local": local,
+                                "Situacao": situacao_desc,
+                                "Data": data_situacao
+                            }
+                    except Exception as e:
+                        logger.error(f"Erro ao processar situação atual do PL {sigla} {numero}/{ano}: {str(e)}")
+            
+            # Adicionar o código da matéria para uso futuro
+            processed_data["CodigoMateria"] = codigo_materia
+            processed_data["Sigla"] = sigla
+            processed_data["Numero"] = numero
+            processed_data["Ano"] = ano
+            
+            return processed_data
+        except Exception as e:
+            logger.error(f"Erro ao processar dados do PL {sigla} {numero}/{ano}: {str(e)}")
+            return {}
+        
     def search_pls(self, keywords: List[str] = None, date_from: str = None, 
                   date_to: str = None, author: str = None, limit: int = 20) -> List[Dict]:
         """
@@ -130,63 +186,32 @@ class MateriasCollector(SenadoAPIBase):
         # Endpoint para pesquisa
         endpoint = "materia/pesquisa/lista"
         
-        # Parâmetros da busca
+        # Parâmetros da busca. Filtros vazios não são enviados, para que consultas
+        # equivalentes gerem a mesma URL e a mesma chave de cache
         params = {
-            "sigla": "PL",  # Tipo de matéria: Projeto de Lei
-            "numero": "",
-            "ano": "",
-            "palavras": " ".join(keywords) if keywords else "",
-            "autor": author or "",
-            "dataInicio": date_from or "",
-            "dataFim": date_to or "",
-            "catalogo": "",
-            "limit": limit
+            key: value for key, value in (
+                ("sigla", "PL"),  # Tipo de matéria: Projeto de Lei
+                ("palavras", " ".join(keywords) if keywords else None),
+                ("autor", author),
+                ("dataInicio", date_from),
+                ("dataFim", date_to),
+                ("limit", limit)
+            ) if value not in (None, "")
         }
         
         # Fazer requisição
-        data, from_cache = self._make_request(endpoint, params)
+        data, _ = self._make_request(endpoint, params)
         
         # Processar resposta
-        if not from_cache:
-            try:
-                materias = data.get('PesquisaBasicaMateria', {}).get('Materias', {}).get('Materia', [])
-                
-                # Garantir que seja uma lista
-                if not isinstance(materias, list):
-                    materias = [materias]
-                
-                # Extrair dados relevantes
-                processed_data = []
-                for materia in materias:
-                    # Extrair sigla, número e ano do IdentificacaoMateria
-                    identificacao = materia.get('IdentificacaoMateria', {})
-                    sigla = identificacao.get('SiglaSubtipoMateria', '')
-                    numero = identificacao.get('NumeroMateria', '')
-                    ano = identificacao.get('AnoMateria', '')
-                    codigo = identificacao.get('CodigoMateria', '')
-                    
-                    processed_data.append({
-                        "ID": f"{sigla} {numero}/{ano}",
-                        "Sigla": sigla,
-                        "Numero": numero,
-                        "Ano": ano,
-                        "CodigoMateria": codigo,
-                        "Título": materia.get('EmentaMateria', ''),
-                        "Data": materia.get('DataApresentacao', ''),
-                        "Autor": self._extract_autor_from_search(materia),
-                        "Status": self._extract_status_from_search(materia),
-                        "URL": self._build_pl_url(sigla, numero, ano, codigo),
-                        "Palavras-chave": ""  # A API de pesquisa não retorna palavras-chave diretamente
-                    })
-                
-                return processed_data
-            except Exception as e:
-                logger.error(f"Erro ao processar resultados da busca: {str(e)}")
-                return []
-        else:
-            # Se veio do cache, retorna diretamente
-            return data
-    
+        try:
+            materias = as_list(data.get('PesquisaBasicaMateria', {}).get('Materias', {}).get('Materia', []))
+            
+            # Extrair dados relevantes
+            return self._materias_to_rows(materias)
+        except Exception as e:
+            logger.error(f"Erro ao processar resultados da busca: {str(e)}")
+            return []
+        
     def search_multiple_keywords(self, keywords: List[str], 
                                start_date: str = None, 
                                end_date: str = None,
@@ -254,10 +279,7 @@ class MateriasCollector(SenadoAPIBase):
             return df
         else:
             # Retornar DataFrame vazio com colunas esperadas
-            return pd.DataFrame(columns=[
-                'ID', 'Sigla', 'Numero', 'Ano', 'CodigoMateria', 'Título', 'Data', 
-                'Autor', 'Status', 'URL', 'Palavras-chave', 'Palavras-chave Correspondidas'
-            ])
+            return pd.DataFrame(columns=[*PL_ROW_FIELDS, 'Palavras-chave Correspondidas'])
     
     def get_recent_pls(self, limit: int = 10) -> List[Dict]:
         """
@@ -282,140 +304,99 @@ class MateriasCollector(SenadoAPIBase):
         }
         
         # Fazer requisição
-        data, from_cache = self._make_request(endpoint, params)
+        data, _ = self._make_request(endpoint, params)
         
         # Processar resposta
-        if not from_cache:
-            try:
-                materias = data.get('PesquisaBasicaMateria', {}).get('Materias', {}).get('Materia', [])
-                
-                # Garantir que seja uma lista
-                if not isinstance(materias, list):
-                    materias = [materias]
-                
-                # Extrair dados relevantes
-                processed_data = []
-                for materia in materias:
-                    # Extrair sigla, número e ano do IdentificacaoMateria
-                    identificacao = materia.get('IdentificacaoMateria', {})
-                    sigla = identificacao.get('SiglaSubtipoMateria', '')
-                    numero = identificacao.get('NumeroMateria', '')
-                    ano = identificacao.get('AnoMateria', '')
-                    codigo = identificacao.get('CodigoMateria', '')
-                    
-                    processed_data.append({
-                        "ID": f"{sigla} {numero}/{ano}",
-                        "Sigla": sigla,
-                        "Numero": numero,
-                        "Ano": ano,
-                        "CodigoMateria": codigo,
-                        "Título": materia.get('EmentaMateria', ''),
-                        "Data": materia.get('DataApresentacao', ''),
-                        "Autor": self._extract_autor_from_search(materia),
-                        "Status": self._extract_status_from_search(materia),
-                        "URL": self._build_pl_url(sigla, numero, ano, codigo)
-                    })
-                
-                return processed_data
-            except Exception as e:
-                logger.error(f"Erro ao processar PLs recentes: {str(e)}")
-                return []
-        else:
-            # Se veio do cache, retorna diretamente
-            return data
-    
-    def _extract_autor(self, materia: Dict) -> str:
-        """
-        Extrai o nome do autor de uma matéria detalhada.
-        
-        Args:
-            materia: Dados da matéria
-            
-        Returns:
-            Nome do autor
-        """
         try:
-            # Primeiro, tentar pegar do DadosBasicosMateria
-            autor_basico = materia.get('DadosBasicosMateria', {}).get('NomeAutor', '')
-            if autor_basico:
-                return autor_basico
+            materias = as_list(data.get('PesquisaBasicaMateria', {}).get('Materias', {}).get('Materia', []))
             
-            # Se não tiver lá, tentar na Autoria
-            autoria = materia.get('Autoria', {})
-            if isinstance(autoria, dict):
-                autores = autoria.get('Autor', [])
-                
-                # Garantir que seja uma lista
-                if not isinstance(autores, list):
-                    autores = [autores]
-                
-                # Extrair nomes dos autores
-                nomes_autores = []
-                for autor in autores:
-                    nome = autor.get('NomeAutor', '')
-                    if nome:
-                        nomes_autores.append(nome)
-                
-                # Retornar string com autores separados por vírgula
-                return ", ".join(nomes_autores) if nomes_autores else "Não informado"
-            
-            return "Não informado"
+            # Extrair dados relevantes
+            return self._materias_to_rows(materias, include_keywords=False)
         except Exception as e:
-            logger.error(f"Erro ao extrair autor: {str(e)}")
-            return "Não informado"
-    
-    def _extract_autor_from_search(self, materia: Dict) -> str:
+            logger.error(f"Erro ao processar PLs recentes: {str(e)}")
+            return []
+        
+    def _materias_to_rows(self, materias: List[Any], include_keywords: bool = True) -> List[Dict]:
         """
-        Extrai o nome do autor de uma matéria retornada pela pesquisa.
+        Converte as matérias da pesquisa em linhas, validando o formato de cada uma.
+        
+        A validação é feita uma única vez aqui; os extratores assumem um dicionário
+        e erros inesperados sobem para o tratador da chamada pública.
         
         Args:
-            materia: Dados da matéria da pesquisa
+            materias: Lista de matérias retornadas pela pesquisa
+            include_keywords: Se True, inclui a coluna "Palavras-chave" (vazia)
             
         Returns:
-            Nome do autor
+            Lista de dicionários com os campos do PL
         """
-        try:
-            # Na pesquisa, o autor pode estar em formato diferente
-            autor = materia.get('AutoriaMateria', {})
-            if autor:
-                autor_nome = autor.get('Autor', {}).get('NomeAutor', '')
-                if autor_nome:
-                    return autor_nome
-            
-            return "Não informado"
-        except Exception as e:
-            logger.error(f"Erro ao extrair autor da pesquisa: {str(e)}")
-            return "Não informado"
+        rows = []
+        to_row = self._materia_to_row
+        for materia in materias:
+            if not isinstance(materia, dict):
+                logger.warning("Matéria com formato inesperado ignorada: %s", type(materia).__name__)
+                continue
+            rows.append(to_row(materia, include_keywords))
+        return rows
     
-    def _extract_status_from_search(self, materia: Dict) -> str:
+    @staticmethod
+    def _materia_to_row(materia: Dict, include_keywords: bool = True) -> Dict:
         """
-        Extrai o status atual de uma matéria retornada pela pesquisa.
+        Converte uma matéria retornada pela pesquisa em um dicionário com os campos do PL.
+        
+        Autor, status e URL são extraídos numa única passada sobre a matéria.
         
         Args:
             materia: Dados da matéria da pesquisa
+            include_keywords: Se True, inclui a coluna "Palavras-chave" (vazia)
             
         Returns:
-            Status atual
+            Dicionário com os campos do PL
         """
-        try:
-            situacao = materia.get('SituacaoAtual', {})
-            if situacao:
-                situacao_desc = situacao.get('Descricao', {}).get('DescricaoSituacao', '')
-                local = situacao.get('Local', {}).get('NomeLocal', '')
-                
-                if situacao_desc and local:
-                    return f"{situacao_desc} - {local}"
-                elif situacao_desc:
-                    return situacao_desc
-                elif local:
-                    return f"Em tramitação - {local}"
-            
-            return "Status não informado"
-        except Exception as e:
-            logger.error(f"Erro ao extrair status da pesquisa: {str(e)}")
-            return "Status não informado"
+        # Extrair sigla, número e ano do IdentificacaoMateria
+        identificacao = materia.get('IdentificacaoMateria') or {}
+        sigla = identificacao.get('SiglaSubtipoMateria', '')
+        numero = identificacao.get('NumeroMateria', '')
+        ano = identificacao.get('AnoMateria', '')
+        codigo = identificacao.get('CodigoMateria', '')
+        
+        # Autor: na pesquisa pode vir um único autor ou uma lista (usar o primeiro)
+        autor_info = _dig(materia, 'AutoriaMateria', 'Autor')
+        if isinstance(autor_info, list):
+            autor_info = autor_info[0] if autor_info else {}
+        autor = _dig(autor_info, 'NomeAutor') or "Não informado"
+        
+        # Status a partir da situação atual
+        situacao = materia.get('SituacaoAtual') or {}
+        situacao_desc = _dig(situacao, 'Descricao', 'DescricaoSituacao')
+        local = _dig(situacao, 'Local', 'NomeLocal')
+        if situacao_desc and local:
+            status = f"{situacao_desc} - {local}"
+        elif situacao_desc:
+            status = situacao_desc
+        elif local:
+            status = f"Em tramitação - {local}"
+        else:
+            status = "Status não informado"
+        
+        row = {
+            "ID": f"{sigla} {numero}/{ano}",
+            "Sigla": sigla,
+            "Numero": numero,
+            "Ano": ano,
+            "CodigoMateria": codigo,
+            "Título": materia.get('EmentaMateria', ''),
+            "Data": materia.get('DataApresentacao', ''),
+            "Autor": autor,
+            "Status": status,
+            "URL": MateriasCollector._build_pl_url(sigla, numero, ano, codigo)
+        }
+        if include_keywords:
+            row["Palavras-chave"] = ""  # A API de pesquisa não retorna palavras-chave diretamente
+        return row
     
-    def _build_pl_url(self, sigla: str, numero: str, ano: str, codigo_materia: str = None) -> str:
+    @staticmethod
+    def _build_pl_url(sigla: str, numero: str, ano: str, codigo_materia: str = None) -> str:
         """
         Constrói a URL para acessar o PL no site do Senado.
         
@@ -429,9 +410,9 @@ class MateriasCollector(SenadoAPIBase):
             URL para acessar o PL
         """
         if codigo_materia:
-            return f"https://www25.senado.leg.br/web/atividade/materias/-/materia/{codigo_materia}"
+            return PL_URL_PREFIX + str(codigo_materia)
         else:
-            return f"https://www25.senado.leg.br/web/atividade/materias/-/materia/busca?b_pesquisaMaterias=proposicao_{sigla}_{numero}_{ano}"
+            return f"{PL_URL_PREFIX}busca?b_pesquisaMaterias=proposicao_{sigla}_{numero}_{ano}"
     
     def _enrich_with_keywords(self, df: pd.DataFrame) -> None:
         """
@@ -7,11 +7,24 @@ import logging
 import re
 from typing import Dict, List, Any, Optional
 
-from .api_base import SenadoAPIBase
+from .api_base import SenadoAPIBase, as_list
 
 # Configuração de logging
 logger = logging.getLogger("senado_relatoria_collector")
 
+# Padrões comuns para encontrar nomes de relatores nas movimentações, compilados
+# uma única vez. São aplicados ao texto original, pois dependem das iniciais maiúsculas
+_RELATOR_PATTERNS = [re.compile(p) for p in (
+    r"[Dd]esignad[oa] [Rr]elator[,]?\s+[oa]?\s+[Ss]enador[a]?\s+([A-ZÀ-Ú][a-zà-ú]+(?: [A-ZÀ-Ú][a-zà-ú]+)*)",
+    r"[Dd]esignad[oa] [Rr]elator[,]?\s+[Ss]en[.]?\s+([A-ZÀ-Ú][a-zà-ú]+(?: [A-ZÀ-Ú][a-zà-ú]+)*)",
+    r"[Rr]elator[:]?\s+[Ss]enador[a]?\s+([A-ZÀ-Ú][a-zà-ú]+(?: [A-ZÀ-Ú][a-zà-ú]+)*)",
+    r"[Rr]elator[:]?\s+[Ss]en[.]?\s+([A-ZÀ-Ú][a-zà-ú]+(?: [A-ZÀ-Ú][a-zà-ú]+)*)",
+    r"[Ss]enador[a]?\s+([A-ZÀ-Ú][a-zà-ú]+(?: [A-ZÀ-Ú][a-zà-ú]+)*)\s+(?:para|como)\s+[Rr]elator"
+)]
+
+# Partido/UF no formato (PARTIDO-UF) ou (PARTIDO/UF)
+_PARTIDO_UF_PATTERN = re.compile(r"\(([A-Z]+)[\/\-]([A-Z]{2})\)")
+
 class RelatoriaCollector(SenadoAPIBase):
     """Especializado em obter informações de relatores de PLs"""
     
@@ -31,49 +44,41 @@ class RelatoriaCollector(SenadoAPIBase):
         endpoint = f"materia/relatorias/{codigo_materia}"
         
         # Fazer requisição
-        data, from_cache = self._make_request(endpoint)
+        data, _ = self._make_request(endpoint)
         
         if not data:
             logger.warning(f"Relatorias não encontradas para matéria {codigo_materia}")
             return []
         
         # Processar relatores
-        if not from_cache:
-            try:
-                resultado = []
-                # Pegar relatoria atual
-                relatoria_atual = data.get('RelatoriaMateria', {}).get('RelatoriaAtual', {})
-                if relatoria_atual:
-                    relator_atual = self._processar_relator(relatoria_atual.get('Relator', {}), "Atual")
-                    if relator_atual:
-                        resultado.append(relator_atual)
-                
-                # Pegar relatorias encerradas
-                relatorias_encerradas = data.get('RelatoriaMateria', {}).get('RelatoriasEncerradas', {}).get('Relatoria', [])
-                
-                # Garantir que seja uma lista
-                if not isinstance(relatorias_encerradas, list):
-                    relatorias_encerradas = [relatorias_encerradas]
-                
-                # Processar cada relatoria encerrada
-                for relatoria in relatorias_encerradas:
-                    relator = self._processar_relator(relatoria.get('Relator', {}), "Encerrada")
-                    if relator:
-                        # Adicionar datas específicas de relatoria encerrada
-                        relator["DataDesignacao"] = relatoria.get('DataDesignacao', '')
-                        relator["DataDestituicao"] = relatoria.get('DataDestituicao', '')
-                        resultado.append(relator)
-                
-                logger.info(f"Encontrados {len(resultado)} relatores para matéria {codigo_materia}")
-                return resultado
-            except Exception as e:
-                logger.error(f"Erro ao processar relatores da matéria {codigo_materia}: {str(e)}")
-                # Tentar backup a partir das movimentações
-                return self._get_relatores_from_movimentacoes(codigo_materia)
-        else:
-            # Se veio do cache, retorna diretamente
-            return data
-    
+        try:
+            resultado = []
+            # Pegar relatoria atual
+            relatoria_atual = data.get('RelatoriaMateria', {}).get('RelatoriaAtual', {})
+            if relatoria_atual:
+                relator_atual = self._processar_relator(relatoria_atual.get('Relator', {}), "Atual")
+                if relator_atual:
+                    resultado.append(relator_atual)
+            
+            # Pegar relatorias encerradas
+            relatorias_encerradas = as_list(data.get('RelatoriaMateria', {}).get('RelatoriasEncerradas', {}).get('Relatoria', []))
+            
+            # Processar cada relatoria encerrada
+            for relatoria in relatorias_encerradas:
+                relator = self._processar_relator(relatoria.get('Relator', {}), "Encerrada")
+                if relator:
+                    # Adicionar datas específicas de relatoria encerrada
+                    relator["DataDesignacao"] = relatoria.get('DataDesignacao', '')
+                    relator["DataDestituicao"] = relatoria.get('DataDestituicao', '')
+                    resultado.append(relator)
+            
+            logger.info(f"Encontrados {len(resultado)} relatores para matéria {codigo_materia}")
+            return resultado
+        except Exception as e:
+            logger.error(f"Erro ao processar relatores da matéria {codigo_materia}: {str(e)}")
+            # Tentar backup a partir das movimentações
+            return self._get_relatores_from_movimentacoes(codigo_materia)
+        
     def get_relator_atual(self, codigo_materia: str) -> Optional[Dict[str, Any]]:
         """
         Obtém apenas o relator atual de um PL.
@@ -90,31 +95,25 @@ class RelatoriaCollector(SenadoAPIBase):
         endpoint = f"materia/relatorias/{codigo_materia}"
         
         # Fazer requisição
-        data, from_cache = self._make_request(endpoint)
+        data, _ = self._make_request(endpoint)
         
         if not data:
             logger.warning(f"Relatorias não encontradas para matéria {codigo_materia}")
             return None
         
         # Processar relator atual
-        if not from_cache:
-            try:
-                # Pegar relatoria atual
-                relatoria_atual = data.get('RelatoriaMateria', {}).get('RelatoriaAtual', {})
-                if relatoria_atual:
-                    return self._processar_relator(relatoria_atual.get('Relator', {}), "Atual")
-                else:
-                    logger.info(f"Não há relator atual para matéria {codigo_materia}")
-                    return None
-            except Exception as e:
-                logger.error(f"Erro ao processar relator atual da matéria {codigo_materia}: {str(e)}")
+        try:
+            # Pegar relatoria atual
+            relatoria_atual = data.get('RelatoriaMateria', {}).get('RelatoriaAtual', {})
+            if relatoria_atual:
+                return self._processar_relator(relatoria_atual.get('Relator', {}), "Atual")
+            else:
+                logger.info(f"Não há relator atual para matéria {codigo_materia}")
                 return None
-        else:
-            # Se veio do cache, retorna diretamente o primeiro item (relator atual)
-            if isinstance(data, list) and data:
-                return data[0]
-            return data
-    
+        except Exception as e:
+            logger.error(f"Erro ao processar relator atual da matéria {codigo_materia}: {str(e)}")
+            return None
+        
     def _processar_relator(self, relator_data: Dict, tipo_relatoria: str) -> Optional[Dict[str, Any]]:
         """
         Processa dados de um relator.
@@ -163,8 +162,9 @@ class RelatoriaCollector(SenadoAPIBase):
                 resultado["UF"] = ""
             
             return resultado
-        except Exception as e:
-            logger.error(f"Erro ao processar dados do relator: {str(e)}")
+        except (AttributeError, TypeError) as e:
+            # Nó com formato inesperado (ex.: texto ou None no lugar de um dicionário)
+            logger.error("Erro ao processar dados do relator: %s", e)
             return None
     
     def _get_relatores_from_movimentacoes(self, codigo_materia: str) -> List[Dict[str, Any]]:
@@ -184,7 +184,7 @@ class RelatoriaCollector(SenadoAPIBase):
         endpoint = f"materia/movimentacoes/{codigo_materia}"
         
         # Fazer requisição
-        data, from_cache = self._make_request(endpoint)
+        data, _ = self._make_request(endpoint)
         
         if not data:
             logger.warning(f"Movimentações não encontradas para matéria {codigo_materia}")
@@ -198,31 +198,23 @@ class RelatoriaCollector(SenadoAPIBase):
         
         try:
             # Verificar se temos dados de movimentação
-            movimentacoes = data.get('MovimentacaoMateria', {}).get('Movimentacoes', {}).get('Movimentacao', [])
-            
-            # Garantir que seja uma lista
-            if not isinstance(movimentacoes, list):
-                movimentacoes = [movimentacoes]
+            movimentacoes = as_list(data.get('MovimentacaoMateria', {}).get('Movimentacoes', {}).get('Movimentacao', []))
             
             # Procurar por designações de relatores na movimentação
             for evento in movimentacoes:
-                texto = evento.get('TextoMovimentacao', '').lower()
+                texto_original = evento.get('TextoMovimentacao') or ''
+                texto = texto_original.lower()
+                
+                # A maioria dos eventos não menciona relatoria; descartá-los cedo
+                if 'relator' not in texto:
+                    continue
                 
                 # Buscar por menções a designação de relatores
-                if 'relator' in texto and ('designad' in texto or 'indicad' in texto):
+                if 'designad' in texto or 'indicad' in texto:
                     # Tentar extrair o nome do relator usando expressões regulares
-                    # Padrões comuns para encontrar nomes de relatores
-                    patterns = [
-                        r"[Dd]esignad[oa] [Rr]elator[,]?\s+[oa]?\s+[Ss]enador[a]?\s+([A-ZÀ-Ú][a-zà-ú]+(?: [A-ZÀ-Ú][a-zà-ú]+)*)",
-                        r"[Dd]esignad[oa] [Rr]elator[,]?\s+[Ss]en[.]?\s+([A-ZÀ-Ú][a-zà-ú]+(?: [A-ZÀ-Ú][a-zà-ú]+)*)",
-                        r"[Rr]elator[:]?\s+[Ss]enador[a]?\s+([A-ZÀ-Ú][a-zà-ú]+(?: [A-ZÀ-Ú][a-zà-ú]+)*)",
-                        r"[Rr]elator[:]?\s+[Ss]en[.]?\s+([A-ZÀ-Ú][a-zà-ú]+(?: [A-ZÀ-Ú][a-zà-ú]+)*)",
-                        r"senador[a]?\s+([A-ZÀ-Ú][a-zà-ú]+(?: [A-ZÀ-Ú][a-zà-ú]+)*)\s+(?:para|como)\s+relator"
-                    ]
-                    
                     nome_relator = None
-                    for pattern in patterns:
-                        match = re.search(pattern, texto)
+                    for pattern in _RELATOR_PATTERNS:
+                        match = pattern.search(texto_original)
                         if match:
                             nome_relator = match.group(1)
                             break
@@ -231,9 +223,10 @@ class RelatoriaCollector(SenadoAPIBase):
                     if not nome_relator:
                         # Verificar se temos palavras-chave de designação seguidas por nomes próprios
                         keywords = ["relator", "senador", "relatoria"]
-                        words = texto.split()
+                        words = texto_original.split()
                         for i, word in enumerate(words):
-                            if any(keyword in word for keyword in keywords) and i < len(words) - 1:
+                            word_lower = word.lower()
+                            if any(keyword in word_lower for keyword in keywords) and i < len(words) - 1:
                                 # Verificar se a próxima palavra é um possível nome (inicial maiúscula)
                                 if i+1 < len(words):
                                     next_word = words[i+1]
@@ -249,16 +242,20 @@ class RelatoriaCollector(SenadoAPIBase):
                                             nome_relator = " ".join(nome_parts)
                                             break
                     
-                    if nome_relator and nome_relator not in relatores_encontrados:
-                        relatores_encontrados.add(nome_relator)
+                    if not nome_relator:
+                        continue
+                    
+                    # Comparar pelo nome normalizado (espaços e caixa), guardando o original
+                    chave_relator = ' '.join(nome_relator.split()).casefold()
+                    if chave_relator not in relatores_encontrados:
+                        relatores_encontrados.add(chave_relator)
                         
                         # Extrair informações adicionais quando disponíveis
                         partido = ""
                         uf = ""
                         
                         # Buscar por padrões de partido/UF: (PARTIDO-UF) ou (PARTIDO/UF)
-                        partido_uf_pattern = r"\(([A-Z]+)[\/\-]([A-Z]{2})\)"
-                        partido_uf_match = re.search(partido_uf_pattern, texto)
+                        partido_uf_match = _PARTIDO_UF_PATTERN.search(texto_original)
                         
                         if partido_uf_match:
                             partido = partido_uf_match.group(1)
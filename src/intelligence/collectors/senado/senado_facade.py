@@ -6,6 +6,7 @@ com o código existente que usa o senado_api.py.
 """
 import logging
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Tuple
 
 from .api_base import SenadoAPIBase
@@ -19,6 +20,13 @@ from .texto_collector import TextoCollector
 # Configuração de logging
 logger = logging.getLogger("senado_api")
 
+# Limite de requisições simultâneas à API do Senado ao montar os detalhes de um PL
+MAX_CONCURRENT_REQUESTS = 8
+
+# Limite de PLs processados simultaneamente em buscas em lote. Cada PL abre até
+# MAX_CONCURRENT_REQUESTS requisições, então o total fica dentro do pool de conexões
+MAX_CONCURRENT_PLS = 4
+
 class SenadoAPI:
     """
     Fachada que unifica o acesso a todos os coletores específicos 
@@ -37,13 +45,15 @@ class SenadoAPI:
         """
         self.cache_dir = cache_dir
         
-        # Instanciar todos os coletores
+        # Instanciar todos os coletores. Os demais compartilham a sessão HTTP e o
+        # cache do primeiro, para que as consultas paralelas usem o mesmo pool e
+        # uma resposta obtida por um coletor sirva aos outros
         self.materias = MateriasCollector(self.cache_dir)
-        self.tramitacao = TramitacaoCollector(self.cache_dir)
-        self.relatoria = RelatoriaCollector(self.cache_dir)
-        self.autoria = AutoriaCollector(self.cache_dir)
-        self.votacao = VotacaoCollector(self.cache_dir)
-        self.texto = TextoCollector(self.cache_dir)
+        self.tramitacao = TramitacaoCollector(shared=self.materias)
+        self.relatoria = RelatoriaCollector(shared=self.materias)
+        self.autoria = AutoriaCollector(shared=self.materias)
+        self.votacao = VotacaoCollector(shared=self.materias)
+        self.texto = TextoCollector(shared=self.materias)
     
     def get_pl_by_id(self, sigla: str, numero: str, ano: str) -> Dict[str, Any]:
         """
@@ -85,10 +95,10 @@ class SenadoAPI:
         Returns:
             Lista de eventos da tramitação
         """
-        # Se não temos o código da matéria, tentamos obter
+        # Se não temos o código da matéria, tentamos obter. Basta a identificação:
+        # get_pl_by_id também consultaria a situação atual sem necessidade
         if not codigo_materia:
-            pl_details = self.materias.get_pl_by_id(sigla, numero, ano)
-            codigo_materia = pl_details.get('CodigoMateria')
+            codigo_materia = self.materias._extract_codigo_materia(sigla, numero, ano)
         
         if codigo_materia:
             return self.tramitacao.get_tramitacao(codigo_materia)
@@ -157,46 +167,110 @@ class SenadoAPI:
         """
         logger.info(f"Buscando detalhes completos do PL {sigla} {numero}/{ano}")
         
-        # Buscar detalhes básicos
-        pl_details = self.materias.get_pl_by_id(sigla, numero, ano)
-        if not pl_details:
-            logger.warning(f"PL {sigla} {numero}/{ano} não encontrado")
-            return {}
-        
-        # Se temos o código da matéria, buscar informações adicionais
-        codigo_materia = pl_details.get('CodigoMateria')
-        if codigo_materia:
+        # As consultas abaixo são independentes entre si e limitadas por I/O,
+        # então são disparadas em paralelo com concorrência limitada
+        executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS)
+        try:
+            # Votações de comissão só dependem de sigla/número/ano: já podem ser
+            # buscadas enquanto os detalhes básicos (e o código da matéria) chegam
+            votacoes_comissao = executor.submit(self.votacao.get_votacoes_comissao, sigla, numero, ano)
+            
+            # Buscar detalhes básicos
+            pl_details = self.materias.get_pl_by_id(sigla, numero, ano)
+            if not pl_details:
+                logger.warning(f"PL {sigla} {numero}/{ano} não encontrado")
+                return {}
+            
+            # Se temos o código da matéria, buscar informações adicionais
+            codigo_materia = pl_details.get('CodigoMateria')
+            if not codigo_materia:
+                return pl_details
+            
+            tramitacao = executor.submit(self.tramitacao.get_tramitacao, codigo_materia)
+            situacao = executor.submit(self.tramitacao.get_situacao_atual, codigo_materia)
+            relatores = executor.submit(self.relatoria.get_relatores, codigo_materia)
+            texto = executor.submit(self.texto.get_texto_completo, codigo_materia)
+            votacoes = executor.submit(self.votacao.get_votacoes, codigo_materia)
+            emendas = executor.submit(self.texto.get_emendas, codigo_materia)
+            autoria = executor.submit(self.autoria.get_autoria_detalhada, codigo_materia)
+            estatisticas = executor.submit(self.votacao.get_estatisticas_votacoes, codigo_materia)
+            prazos = executor.submit(self.tramitacao.get_prazos, codigo_materia)
+            atualizacoes = executor.submit(self.tramitacao.get_ultimas_atualizacoes, codigo_materia)
+            
             # Buscar tramitação detalhada
-            pl_details["Tramitacao_Detalhada"] = self.tramitacao.get_tramitacao(codigo_materia)
+            pl_details["Tramitacao_Detalhada"] = tramitacao.result()
             
             # Buscar situação atual
-            pl_details["Situacao"] = self.tramitacao.get_situacao_atual(codigo_materia)
+            pl_details["Situacao"] = situacao.result()
             
             # Buscar relatores (usando endpoint correto)
-            pl_details["Relatores"] = self.relatoria.get_relatores(codigo_materia)
+            pl_details["Relatores"] = relatores.result()
             
             # Buscar texto completo
-            pl_details["Texto"] = self.texto.get_texto_completo(codigo_materia)
+            pl_details["Texto"] = texto.result()
             
             # Buscar votações
-            pl_details["Votacoes"] = self.votacao.get_votacoes(codigo_materia)
+            pl_details["Votacoes"] = votacoes.result()
             
             # Buscar votações em comissões (endpoint alternativo)
-            pl_details["VotacoesComissao"] = self.votacao.get_votacoes_comissao(sigla, numero, ano)
+            pl_details["VotacoesComissao"] = votacoes_comissao.result()
             
             # Buscar emendas
-            pl_details["Emendas"] = self.texto.get_emendas(codigo_materia)
+            pl_details["Emendas"] = emendas.result()
             
             # Buscar autoria detalhada
             pl_details["detalhes_adicionais"] = {
-                "autoria_detalhada": self.autoria.get_autoria_detalhada(codigo_materia),
+                "autoria_detalhada": autoria.result(),
                 # Informações extras podem ser adicionadas aqui
-                "estatisticas_votacao": self.votacao.get_estatisticas_votacoes(codigo_materia),
-                "prazos": self.tramitacao.get_prazos(codigo_materia),
-                "atualizacoes_recentes": self.tramitacao.get_ultimas_atualizacoes(codigo_materia)
+                "estatisticas_votacao": estatisticas.result(),
+                "prazos": prazos.result(),
+                "atualizacoes_recentes": atualizacoes.result()
             }
+            
+            return pl_details
+        finally:
+            # Não esperar pela consulta especulativa de votações de comissão quando ela
+            # não é usada (PL inexistente ou sem código): o retorno é imediato e o que
+            # ainda não começou é cancelado
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def get_multiple_pl_details(self, pls: List[Tuple[str, str, str]]) -> List[Dict[str, Any]]:
+        """
+        Obtém detalhes completos de vários PLs, processando alguns em paralelo.
+        
+        Novas tentativas com espera para respostas 429/5xx (respeitando Retry-After)
+        ficam a cargo da sessão HTTP compartilhada.
+        
+        Args:
+            pls: Lista de tuplas (sigla, numero, ano)
+            
+        Returns:
+            Lista de dicionários de detalhes, na mesma ordem da entrada
+            (dicionário vazio para PLs não encontrados ou com erro)
+        """
+        def fetch(pl: Tuple[str, str, str]) -> Dict[str, Any]:
+            try:
+                return self.get_additional_pl_details(*pl)
+            except Exception as e:
+                logger.error(f"Erro ao buscar detalhes do PL {pl}: {str(e)}")
+                return {}
         
-        return pl_details
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_PLS) as executor:
+            return list(executor.map(fetch, pls))
+    
+    def get_cached_response(self, endpoint: str, params: Dict = None) -> Optional[Dict]:
+        """
+        Obtém a resposta bruta de um endpoint diretamente do cache, sem acessar a API.
+        
+        Args:
+            endpoint: Endpoint da API (ex: materia/PL/2234/2022)
+            params: Parâmetros da requisição
+            
+        Returns:
+            Dados brutos do cache ou None se não disponível ou expirado
+        """
+        # Todos os coletores compartilham o mesmo cache
+        return self.materias._load_from_cache(endpoint, params or {})
     
     def set_cache_policy(self, use_cache: bool, expiration_hours: int = 12):
         """
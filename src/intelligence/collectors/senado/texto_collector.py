@@ -5,7 +5,7 @@ Coletor especializado em textos e emendas de PLs.
 import logging
 from typing import Dict, List, Any, Optional
 
-from .api_base import SenadoAPIBase
+from .api_base import SenadoAPIBase, as_list
 
 # Configuração de logging
 logger = logging.getLogger("senado_texto_collector")
@@ -29,7 +29,7 @@ class TextoCollector(SenadoAPIBase):
         endpoint = f"materia/textos/{codigo_materia}"
         
         # Fazer requisição
-        data, from_cache = self._make_request(endpoint)
+        data, _ = self._make_request(endpoint)
         
         if not data:
             logger.warning(f"Textos não encontrados para matéria {codigo_materia}")
@@ -44,64 +44,23 @@ class TextoCollector(SenadoAPIBase):
             }
         
         # Processar textos
-        if not from_cache:
-            try:
-                # Extrair dados dos textos
-                textos = data.get('TextoMateria', {}).get('Materia', {}).get('Textos', {}).get('Texto', [])
-                
-                # Garantir que seja uma lista
-                if not isinstance(textos, list):
-                    textos = [textos]
-                
-                # Buscar texto mais atual
-                texto_atual = None
-                for texto in textos:
-                    if texto.get('IndicadorTextoAtual', '') == 'Sim':
-                        texto_atual = texto
-                        break
-                
-                # Se não encontrou texto atual, pega o último
-                if not texto_atual and textos:
-                    texto_atual = textos[-1]
-                
-                # Se ainda não temos texto, retornar valores vazios
-                if not texto_atual:
-                    return {
-                        "UrlTexto": "",
-                        "UrlRedacao": "",
-                        "TextoAtual": "",
-                        "TextoIntegral": "",
-                        "DataApresentacao": "",
-                        "Ementa": "",
-                        "ExplicacaoEmenta": ""
-                    }
-                
-                # Extrair URLs dos textos
-                url_texto = texto_atual.get('UrlTexto', '')
-                url_redacao = texto_atual.get('UrlRedacaoFinal', '')
-                
-                # Dados básicos da matéria
-                dados_basicos = data.get('TextoMateria', {}).get('Materia', {}).get('DadosBasicosMateria', {})
-                
-                resultado = {
-                    "UrlTexto": url_texto,
-                    "UrlRedacao": url_redacao,
-                    "TextoAtual": "Sim" if texto_atual.get('IndicadorTextoAtual', '') == 'Sim' else "Não",
-                    "TextoIntegral": "",  # Implementação futura: baixar o texto de url_texto
-                    "DataApresentacao": dados_basicos.get('DataApresentacao', ''),
-                    "Ementa": dados_basicos.get('EmentaMateria', ''),
-                    "ExplicacaoEmenta": dados_basicos.get('ExplicacaoEmentaMateria', '')
-                }
-                
-                # Se tiver URL, tentar baixar o texto
-                if url_texto:
-                    texto_integral = self._baixar_texto(url_texto)
-                    if texto_integral:
-                        resultado["TextoIntegral"] = texto_integral
-                
-                return resultado
-            except Exception as e:
-                logger.error(f"Erro ao processar textos da matéria {codigo_materia}: {str(e)}")
+        try:
+            # Extrair dados dos textos
+            textos = as_list(data.get('TextoMateria', {}).get('Materia', {}).get('Textos', {}).get('Texto', []))
+            
+            # Buscar texto mais atual
+            texto_atual = None
+            for texto in textos:
+                if texto.get('IndicadorTextoAtual', '') == 'Sim':
+                    texto_atual = texto
+                    break
+            
+            # Se não encontrou texto atual, pega o último
+            if not texto_atual and textos:
+                texto_atual = textos[-1]
+            
+            # Se ainda não temos texto, retornar valores vazios
+            if not texto_atual:
                 return {
                     "UrlTexto": "",
                     "UrlRedacao": "",
@@ -111,10 +70,43 @@ class TextoCollector(SenadoAPIBase):
                     "Ementa": "",
                     "ExplicacaoEmenta": ""
                 }
-        else:
-            # Se veio do cache, retorna diretamente
-            return data
-    
+            
+            # Extrair URLs dos textos
+            url_texto = texto_atual.get('UrlTexto', '')
+            url_redacao = texto_atual.get('UrlRedacaoFinal', '')
+            
+            # Dados básicos da matéria
+            dados_basicos = data.get('TextoMateria', {}).get('Materia', {}).get('DadosBasicosMateria', {})
+            
+            resultado = {
+                "UrlTexto": url_texto,
+                "UrlRedacao": url_redacao,
+                "TextoAtual": "Sim" if texto_atual.get('IndicadorTextoAtual', '') == 'Sim' else "Não",
+                "TextoIntegral": "",  # Implementação futura: baixar o texto de url_texto
+                "DataApresentacao": dados_basicos.get('DataApresentacao', ''),
+                "Ementa": dados_basicos.get('EmentaMateria', ''),
+                "ExplicacaoEmenta": dados_basicos.get('ExplicacaoEmentaMateria', '')
+            }
+            
+            # Se tiver URL, tentar baixar o texto
+            if url_texto:
+                texto_integral = self._baixar_texto(url_texto)
+                if texto_integral:
+                    resultado["TextoIntegral"] = texto_integral
+            
+            return resultado
+        except Exception as e:
+            logger.error(f"Erro ao processar textos da matéria {codigo_materia}: {str(e)}")
+            return {
+                "UrlTexto": "",
+                "UrlRedacao": "",
+                "TextoAtual": "",
+                "TextoIntegral": "",
+                "DataApresentacao": "",
+                "Ementa": "",
+                "ExplicacaoEmenta": ""
+            }
+        
     def _baixar_texto(self, url: str) -> str:
         """
         Baixa o texto de uma URL.
@@ -162,38 +154,30 @@ class TextoCollector(SenadoAPIBase):
         endpoint = f"materia/emendas/{codigo_materia}"
         
         # Fazer requisição
-        data, from_cache = self._make_request(endpoint)
+        data, _ = self._make_request(endpoint)
         
         if not data:
             logger.warning(f"Emendas não encontradas para matéria {codigo_materia}")
             return []
         
         # Processar emendas
-        if not from_cache:
-            try:
-                # Extrair dados das emendas
-                emendas = data.get('EmendaMateria', {}).get('Materia', {}).get('Emendas', {}).get('Emenda', [])
-                
-                # Garantir que seja uma lista
-                if not isinstance(emendas, list):
-                    emendas = [emendas]
-                
-                # Processar cada emenda
-                resultado = []
-                for emenda in emendas:
-                    emenda_processada = self._processar_emenda(emenda)
-                    if emenda_processada:
-                        resultado.append(emenda_processada)
-                
-                logger.info(f"Encontradas {len(resultado)} emendas para matéria {codigo_materia}")
-                return resultado
-            except Exception as e:
-                logger.error(f"Erro ao processar emendas da matéria {codigo_materia}: {str(e)}")
-                return []
-        else:
-            # Se veio do cache, retorna diretamente
-            return data
-    
+        try:
+            # Extrair dados das emendas
+            emendas = as_list(data.get('EmendaMateria', {}).get('Materia', {}).get('Emendas', {}).get('Emenda', []))
+            
+            # Processar cada emenda
+            resultado = []
+            for emenda in emendas:
+                emenda_processada = self._processar_emenda(emenda)
+                if emenda_processada:
+                    resultado.append(emenda_processada)
+            
+            logger.info(f"Encontradas {len(resultado)} emendas para matéria {codigo_materia}")
+            return resultado
+        except Exception as e:
+            logger.error(f"Erro ao processar emendas da matéria {codigo_materia}: {str(e)}")
+            return []
+        
     def _processar_emenda(self, emenda_data: Dict) -> Optional[Dict[str, Any]]:
         """
         Processa dados de uma emenda.
@@ -250,5 +234,5 @@ class TextoCollector(SenadoAPIBase):
             
             return resultado
         except Exception as e:
-            logger.error(f"Erro ao processar dados da emenda: {str(e)}")
+            logger.error("Erro ao processar dados da emenda: %s", e)
             return None
\ No newline at end of file
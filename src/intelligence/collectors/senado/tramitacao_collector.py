@@ -3,10 +3,12 @@
 Coletor especializado em tramitação e situação atual de PLs.
 """
 import logging
+import re
+from operator import itemgetter
 from typing import Dict, List, Any, Optional
-from datetime import datetime
+from datetime import datetime, timedelta
 
-from .api_base import SenadoAPIBase
+from .api_base import SenadoAPIBase, as_list
 
 # Configuração de logging
 logger = logging.getLogger("senado_tramitacao_collector")
@@ -30,7 +32,7 @@ class TramitacaoCollector(SenadoAPIBase):
         endpoint = f"materia/situacaoatual/{codigo_materia}"
         
         # Fazer requisição
-        data, from_cache = self._make_request(endpoint)
+        data, _ = self._make_request(endpoint)
         
         if not data:
             logger.warning(f"Situação atual não encontrada para matéria {codigo_materia}")
@@ -41,27 +43,23 @@ class TramitacaoCollector(SenadoAPIBase):
             }
         
         # Processar situação atual
-        if not from_cache:
-            try:
-                situacao = data.get('SituacaoAtualMateria', {}).get('Materia', {})
+        try:
+            situacao = data.get('SituacaoAtualMateria', {}).get('Materia', {})
+            
+            if situacao:
+                local = situacao.get('Local', {}).get('NomeLocal', '')
+                sigla_local = situacao.get('Local', {}).get('SiglaLocal', '')
+                situacao_desc = situacao.get('Situacao', {}).get('DescricaoSituacao', '')
+                data_situacao = situacao.get('Situacao', {}).get('DataSituacao', '')
                 
-                if situacao:
-                    local = situacao.get('Local', {}).get('NomeLocal', '')
-                    sigla_local = situacao.get('Local', {}).get('SiglaLocal', '')
-                    situacao_desc = situacao.get('Situacao', {}).get('DescricaoSituacao', '')
-                    data_situacao = situacao.get('Situacao', {}).get('DataSituacao', '')
-                    
-                    return {
-                        "Local": local,
-                        "SiglaLocal": sigla_local,
-                        "Situacao": situacao_desc,
-                        "Data": data_situacao
-                    }
-            except Exception as e:
-                logger.error(f"Erro ao processar situação atual da matéria {codigo_materia}: {str(e)}")
-        else:
-            # Se veio do cache, retorna diretamente
-            return data
+                return {
+                    "Local": local,
+                    "SiglaLocal": sigla_local,
+                    "Situacao": situacao_desc,
+                    "Data": data_situacao
+                }
+        except Exception as e:
+            logger.error(f"Erro ao processar situação atual da matéria {codigo_materia}: {str(e)}")
         
         return {
             "Local": "",
@@ -85,43 +83,36 @@ class TramitacaoCollector(SenadoAPIBase):
         endpoint = f"materia/movimentacoes/{codigo_materia}"
         
         # Fazer requisição
-        data, from_cache = self._make_request(endpoint)
+        data, _ = self._make_request(endpoint)
         
         if not data:
             logger.warning(f"Tramitação não encontrada para matéria {codigo_materia}")
             return []
         
         # Processar tramitação
-        if not from_cache:
-            try:
-                movimentacoes = data.get('MovimentacaoMateria', {}).get('Movimentacoes', {}).get('Movimentacao', [])
-                
-                # Garantir que seja uma lista
-                if not isinstance(movimentacoes, list):
-                    movimentacoes = [movimentacoes]
-                
-                # Processar cada evento
-                processed_data = []
-                for evento in movimentacoes:
-                    processed_data.append({
-                        "Data": evento.get('DataMovimentacao', ''),
-                        "Local": evento.get('Local', {}).get('NomeLocal', ''),
-                        "SiglaLocal": evento.get('Local', {}).get('SiglaLocal', ''),
-                        "Situacao": evento.get('Situacao', {}).get('DescricaoSituacao', ''),
-                        "Texto": evento.get('TextoMovimentacao', '')
-                    })
-                
-                # Ordenar por data (mais recente primeiro)
-                processed_data.sort(key=lambda x: x.get('Data', ''), reverse=True)
-                
-                return processed_data
-            except Exception as e:
-                logger.error(f"Erro ao processar tramitação da matéria {codigo_materia}: {str(e)}")
-                return []
-        else:
-            # Se veio do cache, retorna diretamente
-            return data
-    
+        try:
+            movimentacoes = as_list(data.get('MovimentacaoMateria', {}).get('Movimentacoes', {}).get('Movimentacao', []))
+            
+            # Processar cada evento (elementos vazios do XML chegam como None)
+            processed_data = [
+                {
+                    "Data": evento.get('DataMovimentacao') or '',
+                    "Local": (evento.get('Local') or {}).get('NomeLocal', ''),
+                    "SiglaLocal": (evento.get('Local') or {}).get('SiglaLocal', ''),
+                    "Situacao": (evento.get('Situacao') or {}).get('DescricaoSituacao', ''),
+                    "Texto": evento.get('TextoMovimentacao', '')
+                }
+                for evento in movimentacoes if evento
+            ]
+            
+            # Ordenar por data (mais recente primeiro)
+            processed_data.sort(key=itemgetter('Data'), reverse=True)
+            
+            return processed_data
+        except Exception as e:
+            logger.error(f"Erro ao processar tramitação da matéria {codigo_materia}: {str(e)}")
+            return []
+        
     def get_ultimas_atualizacoes(self, codigo_materia: str) -> List[Dict[str, Any]]:
         """
         Obtém as últimas atualizações da matéria (inclui alterações recentes).
@@ -138,44 +129,36 @@ class TramitacaoCollector(SenadoAPIBase):
         endpoint = f"materia/atualizacoes/{codigo_materia}"
         
         # Fazer requisição
-        data, from_cache = self._make_request(endpoint)
+        data, _ = self._make_request(endpoint)
         
         if not data:
             logger.warning(f"Atualizações não encontradas para matéria {codigo_materia}")
             return []
         
         # Processar atualizações
-        if not from_cache:
-            try:
-                atualizacoes = data.get('AtualizacoesMateria', {}).get('Atualizacoes', {}).get('Atualizacao', [])
-                
-                # Garantir que seja uma lista
-                if not isinstance(atualizacoes, list):
-                    atualizacoes = [atualizacoes]
-                
-                # Processar cada atualização
-                processed_data = []
-                for atualizacao in atualizacoes:
-                    processed_data.append({
-                        "Data": atualizacao.get('DataAtualizacao', ''),
-                        "DescricaoAtualizacao": atualizacao.get('DescricaoAtualizacao', ''),
-                        "SituacaoAnterior": atualizacao.get('SituacaoAnterior', {}).get('DescricaoSituacao', ''),
-                        "SituacaoAtual": atualizacao.get('SituacaoAtual', {}).get('DescricaoSituacao', ''),
-                        "LocalAnterior": atualizacao.get('LocalAnterior', {}).get('NomeLocal', ''),
-                        "LocalAtual": atualizacao.get('LocalAtual', {}).get('NomeLocal', '')
-                    })
-                
-                # Ordenar por data (mais recente primeiro)
-                processed_data.sort(key=lambda x: x.get('Data', ''), reverse=True)
-                
-                return processed_data
-            except Exception as e:
-                logger.error(f"Erro ao processar atualizações da matéria {codigo_materia}: {str(e)}")
-                return []
-        else:
-            # Se veio do cache, retorna diretamente
-            return data
-    
+        try:
+            atualizacoes = as_list(data.get('AtualizacoesMateria', {}).get('Atualizacoes', {}).get('Atualizacao', []))
+            
+            # Processar cada atualização
+            processed_data = []
+            for atualizacao in atualizacoes:
+                processed_data.append({
+                    "Data": atualizacao.get('DataAtualizacao', ''),
+                    "DescricaoAtualizacao": atualizacao.get('DescricaoAtualizacao', ''),
+                    "SituacaoAnterior": atualizacao.get('SituacaoAnterior', {}).get('DescricaoSituacao', ''),
+                    "SituacaoAtual": atualizacao.get('SituacaoAtual', {}).get('DescricaoSituacao', ''),
+                    "LocalAnterior": atualizacao.get('LocalAnterior', {}).get('NomeLocal', ''),
+                    "LocalAtual": atualizacao.get('LocalAtual', {}).get('NomeLocal', '')
+                })
+            
+            # Ordenar por data (mais recente primeiro)
+            processed_data.sort(key=lambda x: x.get('Data', ''), reverse=True)
+            
+            return processed_data
+        except Exception as e:
+            logger.error(f"Erro ao processar atualizações da matéria {codigo_materia}: {str(e)}")
+            return []
+        
     def get_prazos(self, codigo_materia: str) -> List[Dict[str, Any]]:
         """
         Obtém os prazos relacionados à tramitação.
@@ -199,7 +182,6 @@ class TramitacaoCollector(SenadoAPIBase):
             # Procurar menções a prazos
             if 'prazo' in texto:
                 # Identificar possíveis datas de prazo
-                import re
                 # Padrão para prazo em dias (ex: "prazo de 10 dias")
                 dias_match = re.search(r'prazo\s+(?:de|para|é|:)?\s+(\d+)\s+dias?', texto)
                 # Padrão para data específica (ex: "prazo até 15/12/2023")
@@ -219,7 +201,6 @@ class TramitacaoCollector(SenadoAPIBase):
                     
                     # Calcular data de término (aproximada)
                     try:
-                        from datetime import datetime, timedelta
                         data_inicio = datetime.strptime(data, "%Y-%m-%d")
                         data_fim = data_inicio + timedelta(days=dias)
                         prazo_info["DataFim"] = data_fim.strftime("%Y-%m-%d")
@@ -5,7 +5,7 @@ Coletor especializado em votações de PLs.
 import logging
 from typing import Dict, List, Any, Optional
 
-from .api_base import SenadoAPIBase
+from .api_base import SenadoAPIBase, as_list
 
 # Configuração de logging
 logger = logging.getLogger("senado_votacao_collector")
@@ -29,38 +29,30 @@ class VotacaoCollector(SenadoAPIBase):
         endpoint = f"materia/votacoes/{codigo_materia}"
         
         # Fazer requisição
-        data, from_cache = self._make_request(endpoint)
+        data, _ = self._make_request(endpoint)
         
         if not data:
             logger.warning(f"Votações não encontradas para matéria {codigo_materia}")
             return []
         
         # Processar votações
-        if not from_cache:
-            try:
-                # Extrair dados de votação
-                votacoes = data.get('VotacaoMateria', {}).get('Votacoes', {}).get('Votacao', [])
-                
-                # Garantir que seja uma lista
-                if not isinstance(votacoes, list):
-                    votacoes = [votacoes]
-                
-                # Processar cada votação
-                resultado = []
-                for votacao in votacoes:
-                    votacao_processada = self._processar_votacao(votacao)
-                    if votacao_processada:
-                        resultado.append(votacao_processada)
-                
-                logger.info(f"Encontradas {len(resultado)} votações para matéria {codigo_materia}")
-                return resultado
-            except Exception as e:
-                logger.error(f"Erro ao processar votações da matéria {codigo_materia}: {str(e)}")
-                return []
-        else:
-            # Se veio do cache, retorna diretamente
-            return data
-    
+        try:
+            # Extrair dados de votação
+            votacoes = as_list(data.get('VotacaoMateria', {}).get('Votacoes', {}).get('Votacao', []))
+            
+            # Processar cada votação
+            resultado = []
+            for votacao in votacoes:
+                votacao_processada = self._processar_votacao(votacao)
+                if votacao_processada:
+                    resultado.append(votacao_processada)
+            
+            logger.info(f"Encontradas {len(resultado)} votações para matéria {codigo_materia}")
+            return resultado
+        except Exception as e:
+            logger.error(f"Erro ao processar votações da matéria {codigo_materia}: {str(e)}")
+            return []
+        
     def _processar_votacao(self, votacao_data: Dict) -> Optional[Dict[str, Any]]:
         """
         Processa dados de uma votação.
@@ -102,11 +94,7 @@ class VotacaoCollector(SenadoAPIBase):
             votos_parlamentares = []
             
             # Verificar se temos votos detalhados
-            votos_parlamentar = votacao_data.get('Votos', {}).get('VotoParlamentar', [])
-            
-            # Garantir que seja uma lista
-            if not isinstance(votos_parlamentar, list):
-                votos_parlamentar = [votos_parlamentar]
+            votos_parlamentar = as_list(votacao_data.get('Votos', {}).get('VotoParlamentar', []))
                 
             # Processar votos dos parlamentares
             for voto in votos_parlamentar:
@@ -140,7 +128,7 @@ class VotacaoCollector(SenadoAPIBase):
                 "VotosParlamentares": votos_parlamentares
             }
         except Exception as e:
-            logger.error(f"Erro ao processar dados da votação: {str(e)}")
+            logger.error("Erro ao processar dados da votação: %s", e)
             return None
     
     def get_estatisticas_votacoes(self, codigo_materia: str) -> Dict[str, Any]:
@@ -223,39 +211,31 @@ class VotacaoCollector(SenadoAPIBase):
         endpoint = f"votacaoComissao/materia/{sigla}/{numero}/{ano}"
         
         # Fazer requisição
-        data, from_cache = self._make_request(endpoint)
+        data, _ = self._make_request(endpoint)
         
         if not data:
             logger.warning(f"Votações de comissão não encontradas para {sigla} {numero}/{ano}")
             return []
         
         # Processar votações
-        if not from_cache:
-            try:
-                # Extrair dados de votação
-                votacoes = data.get('VotacaoComissaoMateria', {}).get('Materia', {}).get('Votacoes', {}).get('Votacao', [])
-                
-                # Garantir que seja uma lista
-                if not isinstance(votacoes, list):
-                    votacoes = [votacoes]
-                
-                # Processar cada votação
-                resultado = []
-                for votacao in votacoes:
-                    # Processar diferentemente, pois a estrutura é diferente
-                    votacao_processada = self._processar_votacao_comissao(votacao)
-                    if votacao_processada:
-                        resultado.append(votacao_processada)
-                
-                logger.info(f"Encontradas {len(resultado)} votações de comissão para {sigla} {numero}/{ano}")
-                return resultado
-            except Exception as e:
-                logger.error(f"Erro ao processar votações de comissão para {sigla} {numero}/{ano}: {str(e)}")
-                return []
-        else:
-            # Se veio do cache, retorna diretamente
-            return data
-    
+        try:
+            # Extrair dados de votação
+            votacoes = as_list(data.get('VotacaoComissaoMateria', {}).get('Materia', {}).get('Votacoes', {}).get('Votacao', []))
+            
+            # Processar cada votação
+            resultado = []
+            for votacao in votacoes:
+                # Processar diferentemente, pois a estrutura é diferente
+                votacao_processada = self._processar_votacao_comissao(votacao)
+                if votacao_processada:
+                    resultado.append(votacao_processada)
+            
+            logger.info(f"Encontradas {len(resultado)} votações de comissão para {sigla} {numero}/{ano}")
+            return resultado
+        except Exception as e:
+            logger.error(f"Erro ao processar votações de comissão para {sigla} {numero}/{ano}: {str(e)}")
+            return []
+        
     def _processar_votacao_comissao(self, votacao_data: Dict) -> Optional[Dict[str, Any]]:
         """
         Processa dados de uma votação de comissão.
@@ -293,5 +273,5 @@ class VotacaoCollector(SenadoAPIBase):
                 "Observacao": votacao_data.get('Observacao', '')
             }
         except Exception as e:
-            logger.error(f"Erro ao processar dados da votação de comissão: {str(e)}")
+            logger.error("Erro ao processar dados da votação de comissão: %s", e)
             return None
\ No newline at end of file
@@ -4,20 +4,104 @@ Coletor de dados de PLs do Senado.
 Versão MVP: Carrega dados de um CSV local em vez de acessar a API do Senado.
 """
 import os
+import sys
 import csv
+import heapq
 import json
 import logging
-import pandas as pd
-from datetime import datetime
-from typing import Dict, List, Optional, Any
+from datetime import date, datetime
+from typing import Dict, List, Optional, Any, Tuple
 
-# Configuração de logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# A configuração de logging fica a cargo da aplicação (ou do bloco __main__)
 logger = logging.getLogger("senado_collector")
 
+# Colunas do CSV de PLs, na ordem em que são gravadas
+CSV_FIELDS = [
+    "Sigla", "Numero", "Ano", "Título", "Autor",
+    "Data", "Status", "URL", "Palavras-chave"
+]
+
+# Colunas com poucos valores distintos, compartilhados via sys.intern na carga
+INTERNED_FIELDS = ("Sigla", "Autor", "Status")
+
+# Data usada na ordenação de PLs sem data válida
+DEFAULT_PL_DATE = date(2020, 1, 1)
+
+
+def _parse_date(value: Any) -> Optional[date]:
+    """
+    Converte uma data no formato YYYY-MM-DD, retornando None se inválida.
+    """
+    try:
+        return date.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _index_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Adiciona a uma linha do CSV os campos derivados usados nas buscas.
+    
+    Args:
+        row: Linha do CSV como dicionário
+        
+    Returns:
+        A própria linha, com '_date' (data convertida), '_search_blob'
+        (título e palavras-chave em minúsculas), '_autor_casefold' (autor
+        normalizado), '_view' (resumo retornado nas buscas) e '_details'
+        (detalhes retornados por get_pl_by_id)
+    """
+    sigla, numero, ano = row["Sigla"], row["Numero"], row["Ano"]
+    row["_date"] = _parse_date(row.get("Data"))
+    row["_search_blob"] = f"{row.get('Título') or ''}\n{row.get('Palavras-chave') or ''}".lower()
+    row["_autor_casefold"] = (row.get("Autor") or "").casefold()
+    row["_view"] = {
+        "ID": f"{sigla} {numero}/{ano}",
+        "Sigla": sigla,
+        "Numero": numero,
+        "Ano": ano,
+        "Título": row.get("Título", ""),
+        "Autor": row.get("Autor", ""),
+        "Data": row.get("Data", ""),
+        "Status": row.get("Status", ""),
+        "URL": row.get("URL", "")
+    }
+    row["_details"] = {
+        "Título": row.get("Título", ""),
+        "Data": row.get("Data", ""),
+        "Autor": row.get("Autor", ""),
+        "Status": row.get("Status", ""),
+        "URL": row.get("URL", ""),
+        "Palavras-chave": row.get("Palavras-chave", "")
+    }
+    return row
+
+
+def _build_pls_dict(rows) -> Dict[str, Dict[str, Any]]:
+    """
+    Indexa linhas do CSV por ID (sigla_numero_ano), preparando-as para as buscas.
+    
+    Args:
+        rows: Iterável de linhas do CSV como dicionários
+        
+    Returns:
+        Dicionário com dados dos PLs indexados por ID
+    """
+    pls_dict = {
+        f"{row['Sigla']}_{row['Numero']}_{row['Ano']}": row
+        for row in rows
+    }
+    
+    # Pré-calcular uma única vez os campos usados em filtros e ordenação
+    for row in pls_dict.values():
+        for field in INTERNED_FIELDS:
+            value = row.get(field)
+            if value:
+                row[field] = sys.intern(value)
+        _index_row(row)
+    
+    return pls_dict
+
 class SenadoCollector:
     """
     Classe para coletar dados de PLs do Senado.
@@ -45,16 +129,12 @@ class SenadoCollector:
         else:
             self.csv_path = csv_path
         
-        # Garantir que o diretório existe
-        os.makedirs(os.path.dirname(self.csv_path), exist_ok=True)
-        
         # Carregar dados se o CSV existir
         self._pls_data = self._load_pls_data()
         
         # Se não houver dados, criar CSV inicial com dados de exemplo
         if not self._pls_data:
-            self._create_initial_csv()
-            self._pls_data = self._load_pls_data()
+            self._pls_data = self._create_initial_csv()
     
     def _load_pls_data(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -63,28 +143,26 @@ class SenadoCollector:
         Returns:
             Dicionário com dados dos PLs indexados por ID (sigla_numero_ano)
         """
-        if not os.path.exists(self.csv_path):
-            logger.warning(f"Arquivo CSV não encontrado: {self.csv_path}")
-            return {}
-        
         try:
-            df = pd.read_csv(self.csv_path, encoding='utf-8')
-            
-            # Converter DataFrame para dicionário
-            pls_dict = {}
-            for _, row in df.iterrows():
-                pl_id = f"{row['Sigla']}_{row['Numero']}_{row['Ano']}"
-                pls_dict[pl_id] = row.to_dict()
+            # DictReader já entrega cada linha como dicionário de strings
+            with open(self.csv_path, newline='', encoding='utf-8') as f:
+                pls_dict = _build_pls_dict(csv.DictReader(f))
             
             logger.info(f"Carregados {len(pls_dict)} PLs do CSV.")
             return pls_dict
+        except FileNotFoundError:
+            logger.warning(f"Arquivo CSV não encontrado: {self.csv_path}")
+            return {}
         except Exception as e:
             logger.error(f"Erro ao carregar dados do CSV: {str(e)}")
             return {}
     
-    def _create_initial_csv(self):
+    def _create_initial_csv(self) -> Dict[str, Dict[str, Any]]:
         """
         Cria um CSV inicial com dados de exemplo de PLs relevantes para iGaming.
+        
+        Returns:
+            Dicionário com os PLs de exemplo indexados por ID, sem reler o CSV
         """
         logger.info("Criando CSV inicial com PLs de exemplo para iGaming...")
         
@@ -202,11 +280,15 @@ class SenadoCollector:
             }
         ]
         
-        # Criar DataFrame e salvar como CSV
-        df = pd.DataFrame(data)
-        df.to_csv(self.csv_path, index=False, encoding='utf-8')
+        # Salvar como CSV, garantindo que o diretório existe
+        os.makedirs(os.path.dirname(self.csv_path), exist_ok=True)
+        with open(self.csv_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+            writer.writeheader()
+            writer.writerows(data)
         
         logger.info(f"CSV inicial criado com {len(data)} PLs em {self.csv_path}")
+        return _build_pls_dict(data)
     
     def get_pl_by_id(self, sigla: str, numero: str, ano: str) -> Dict[str, Any]:
         """
@@ -228,17 +310,10 @@ class SenadoCollector:
         pl_id = f"{sigla}_{numero}_{ano}"
         
         # Buscar nos dados carregados
-        if pl_id in self._pls_data:
-            # Converter para o formato esperado
-            raw_data = self._pls_data[pl_id]
-            return {
-                "Título": raw_data.get("Título", ""),
-                "Data": raw_data.get("Data", ""),
-                "Autor": raw_data.get("Autor", ""),
-                "Status": raw_data.get("Status", ""),
-                "URL": raw_data.get("URL", ""),
-                "Palavras-chave": raw_data.get("Palavras-chave", "")
-            }
+        raw_data = self._pls_data.get(pl_id)
+        if raw_data is not None:
+            # Cópia dos detalhes pré-montados na carga
+            return raw_data["_details"].copy()
         
         logger.warning(f"PL {sigla} {numero}/{ano} não encontrado")
         return {}
@@ -256,48 +331,89 @@ class SenadoCollector:
         Returns:
             True se adicionou com sucesso, False caso contrário
         """
+        return self.add_pls_bulk([(sigla, numero, ano, details)]) == 1
+    
+    def add_pls_bulk(self, pls: List[Tuple[str, str, str, Dict[str, Any]]]) -> int:
+        """
+        Adiciona vários PLs ao CSV de dados em uma única escrita.
+        
+        Args:
+            pls: Lista de tuplas (sigla, numero, ano, details)
+            
+        Returns:
+            Número de PLs adicionados (PLs já existentes são ignorados)
+        """
         try:
-            # Verificar se o PL já existe no CSV
-            pl_id = f"{sigla}_{numero}_{ano}"
-            if pl_id in self._pls_data:
-                logger.warning(f"PL {sigla} {numero}/{ano} já existe no CSV.")
-                return False
+            today = datetime.now().strftime("%Y-%m-%d")
+            new_rows = {}
             
-            # Carregar DataFrame atual
-            if os.path.exists(self.csv_path):
-                df = pd.read_csv(self.csv_path, encoding='utf-8')
-            else:
-                # Se o CSV não existir, criar um novo DataFrame
-                df = pd.DataFrame(columns=[
-                    "Sigla", "Numero", "Ano", "Título", "Autor", 
-                    "Data", "Status", "URL", "Palavras-chave"
-                ])
+            for sigla, numero, ano, details in pls:
+                # Verificar se o PL já existe no CSV ou no próprio lote
+                pl_id = f"{sigla}_{numero}_{ano}"
+                if pl_id in self._pls_data or pl_id in new_rows:
+                    logger.warning(f"PL {sigla} {numero}/{ano} já existe no CSV.")
+                    continue
+                
+                # Preparar nova linha
+                new_rows[pl_id] = {
+                    "Sigla": sigla,
+                    "Numero": numero,
+                    "Ano": ano,
+                    "Título": details.get("Título", f"[Personalizado] {sigla} {numero}/{ano}"),
+                    "Autor": details.get("Autor", "Usuário"),
+                    "Data": details.get("Data", today),
+                    "Status": details.get("Status", "Personalizado"),
+                    "URL": details.get("URL", ""),
+                    "Palavras-chave": details.get("Palavras-chave", "")
+                }
             
-            # Preparar nova linha
-            new_row = {
-                "Sigla": sigla,
-                "Numero": numero,
-                "Ano": ano,
-                "Título": details.get("Título", f"[Personalizado] {sigla} {numero}/{ano}"),
-                "Autor": details.get("Autor", "Usuário"),
-                "Data": details.get("Data", datetime.now().strftime("%Y-%m-%d")),
-                "Status": details.get("Status", "Personalizado"),
-                "URL": details.get("URL", ""),
-                "Palavras-chave": details.get("Palavras-chave", "")
-            }
+            if not new_rows:
+                return 0
             
-            # Adicionar ao DataFrame e salvar
-            df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-            df.to_csv(self.csv_path, index=False, encoding='utf-8')
+            # Acrescentar apenas as novas linhas ao final do CSV, na ordem de colunas
+            # do cabeçalho já existente
+            fieldnames, needs_newline = self._read_csv_layout()
+            write_header = fieldnames is None
+            with open(self.csv_path, 'a', newline='', encoding='utf-8') as f:
+                if needs_newline:
+                    f.write('\n')
+                writer = csv.DictWriter(f, fieldnames=fieldnames or CSV_FIELDS, extrasaction='ignore')
+                if write_header:
+                    writer.writeheader()
+                writer.writerows(new_rows.values())
             
             # Atualizar dados em memória
-            self._pls_data = self._load_pls_data()
+            for pl_id, row in new_rows.items():
+                self._pls_data[pl_id] = _index_row(row)
             
-            logger.info(f"PL {sigla} {numero}/{ano} adicionado ao CSV com sucesso.")
-            return True
+            logger.info(f"{len(new_rows)} PL(s) adicionado(s) ao CSV com sucesso.")
+            return len(new_rows)
         except Exception as e:
-            logger.error(f"Erro ao adicionar PL ao CSV: {str(e)}")
-            return False
+            logger.error(f"Erro ao adicionar PLs ao CSV: {str(e)}")
+            return 0
+    
+    def _read_csv_layout(self) -> Tuple[Optional[List[str]], bool]:
+        """
+        Lê o cabeçalho do CSV existente e verifica se o arquivo termina em quebra de linha.
+        
+        Returns:
+            Tupla (colunas do cabeçalho ou None se o arquivo não existir/estiver vazio,
+            True se for preciso escrever uma quebra de linha antes de acrescentar)
+        """
+        try:
+            if os.path.getsize(self.csv_path) == 0:
+                return None, False
+        except FileNotFoundError:
+            return None, False
+        
+        with open(self.csv_path, newline='', encoding='utf-8') as f:
+            header = next(csv.reader(f), None)
+        
+        with open(self.csv_path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            needs_newline = f.read(1) not in (b'\n', b'\r')
+        
+        return header or None, needs_newline
     
     def search_pls(self, keywords: List[str] = None, date_from: str = None, 
                   date_to: str = None, author: str = None) -> List[Dict[str, Any]]:
@@ -317,67 +433,40 @@ class SenadoCollector:
         """
         logger.info("Buscando PLs com filtros")
         
+        # Normalizar os filtros uma única vez
+        keywords = [keyword.lower() for keyword in keywords] if keywords else None
+        author = author.casefold() if author else None
+        
+        # Converter as datas dos filtros uma única vez (formato inválido ignora o filtro)
+        from_date = _parse_date(date_from) if date_from else None
+        to_date = _parse_date(date_to) if date_to else None
+        
         # Carregar todos os PLs
         results = []
         
-        for pl_id, pl_data in self._pls_data.items():
-            # Aplicar filtros
-            should_include = True
+        for pl_data in self._pls_data.values():
+            # Aplicar filtros do mais barato ao mais caro, descartando na primeira falha
             
-            # Filtro por palavras-chave
-            if keywords and should_include:
-                keywords_match = False
-                for keyword in keywords:
-                    if (
-                        keyword.lower() in pl_data.get("Título", "").lower() or
-                        keyword.lower() in pl_data.get("Palavras-chave", "").lower()
-                    ):
-                        keywords_match = True
-                        break
-                should_include = keywords_match
+            # Filtro por data (PLs sem data válida não são filtrados)
+            pl_date = pl_data["_date"]
+            if pl_date:
+                if from_date and pl_date < from_date:
+                    continue
+                if to_date and pl_date > to_date:
+                    continue
             
             # Filtro por autor
-            if author and should_include:
-                should_include = author.lower() in pl_data.get("Autor", "").lower()
+            if author and author not in pl_data["_autor_casefold"]:
+                continue
             
-            # Filtro por data
-            if date_from and should_include and "Data" in pl_data:
-                try:
-                    pl_date = datetime.strptime(pl_data["Data"], "%Y-%m-%d")
-                    from_date = datetime.strptime(date_from, "%Y-%m-%d")
-                    should_include = pl_date >= from_date
-                except ValueError:
-                    # Se o formato da data for inválido, ignora este filtro
-                    pass
-            
-            if date_to and should_include and "Data" in pl_data:
-                try:
-                    pl_date = datetime.strptime(pl_data["Data"], "%Y-%m-%d")
-                    to_date = datetime.strptime(date_to, "%Y-%m-%d")
-                    should_include = pl_date <= to_date
-                except ValueError:
-                    # Se o formato da data for inválido, ignora este filtro
-                    pass
+            # Filtro por palavras-chave
+            if keywords:
+                search_blob = pl_data["_search_blob"]
+                if not any(keyword in search_blob for keyword in keywords):
+                    continue
             
-            # Se passou por todos os filtros, adiciona aos resultados
-            if should_include:
-                # Construir resultado no formato esperado
-                parts = pl_id.split("_")
-                sigla, numero, ano = parts[0], parts[1], parts[2]
-                
-                result = {
-                    "ID": f"{sigla} {numero}/{ano}",
-                    "Sigla": sigla,
-                    "Numero": numero,
-                    "Ano": ano,
-                    "Título": pl_data.get("Título", ""),
-                    "Autor": pl_data.get("Autor", ""),
-                    "Data": pl_data.get("Data", ""),
-                    "Status": pl_data.get("Status", ""),
-                    "URL": pl_data.get("URL", "")
-                }
-                
-                results.append(result)
+            # Cópia do resumo pré-montado, para não expor o dado em memória
+            results.append(pl_data["_view"].copy())
         
         logger.info(f"Encontrados {len(results)} PLs correspondentes aos filtros")
         return results
@@ -396,42 +485,14 @@ class SenadoCollector:
         """
         logger.info(f"Buscando {limit} PLs mais recentes")
         
-        # Carregar todos os PLs e ordenar por data
-        pls_list = []
-        for pl_id, pl_data in self._pls_data.items():
-            parts = pl_id.split("_")
-            sigla, numero, ano = parts[0], parts[1], parts[2]
-            
-            pl_with_date = {
-                "ID": f"{sigla} {numero}/{ano}",
-                "Sigla": sigla,
-                "Numero": numero,
-                "Ano": ano,
-                "Título": pl_data.get("Título", ""),
-                "Autor": pl_data.get("Autor", ""),
-                "Data": pl_data.get("Data", ""),
-                "Status": pl_data.get("Status", ""),
-                "URL": pl_data.get("URL", "")
-            }
-            
-            # Adicionar data como objeto datetime para ordenação
-            try:
-                pl_with_date["date_obj"] = datetime.strptime(pl_data.get("Data", "2020-01-01"), "%Y-%m-%d")
-            except ValueError:
-                # Se o formato da data for inválido, usa uma data antiga
-                pl_with_date["date_obj"] = datetime(2020, 1, 1)
-            
-            pls_list.append(pl_with_date)
-        
-        # Ordenar por data em ordem decrescente
-        pls_list.sort(key=lambda x: x["date_obj"], reverse=True)
+        # Selecionar os mais recentes sem ordenar a lista inteira
+        recent = heapq.nlargest(
+            limit,
+            self._pls_data.values(),
+            key=lambda pl_data: pl_data.get("_date") or DEFAULT_PL_DATE
+        )
         
-        # Remover campo auxiliar e limitar resultados
-        results = []
-        for pl in pls_list[:limit]:
-            pl_copy = pl.copy()
-            del pl_copy["date_obj"]
-            results.append(pl_copy)
+        results = [pl_data["_view"].copy() for pl_data in recent]
         
         logger.info(f"Retornando {len(results)} PLs recentes")
         return results
@@ -439,6 +500,12 @@ class SenadoCollector:
 
 # Exemplo de uso
 if __name__ == "__main__":
+    # Configuração de logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
     collector = SenadoCollector()
     
     # Buscar um PL específico
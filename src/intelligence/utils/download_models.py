@@ -1,12 +1,64 @@
 from pathlib import Path
 from datetime import datetime, timezone
+from email.utils import format_datetime
 import os
+import importlib.util
 import logging
-import subprocess
+from logging.handlers import RotatingFileHandler
 import json
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
-import torch
-from transformers import AutoModel, AutoTokenizer
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Raiz do projeto (4 níveis acima, assumindo que o arquivo está em src/intelligence/utils/)
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+# Usar o backend de transferência acelerado (hf_transfer) quando instalado. A variável
+# é lida pelo huggingface_hub ao ser importado, então precisa ser definida antes dele
+if importlib.util.find_spec("hf_transfer") is not None:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
+# orjson é opcional: quando disponível, acelera a (de)serialização do arquivo de status
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger("download_models")
+
+# Downloads simultâneos em --download-all (cada um já baixa vários arquivos em paralelo)
+MAX_PARALLEL_DOWNLOADS = 3
+
+# Arquivos baixados em paralelo por modelo
+MAX_FILE_WORKERS = 8
+
+# Arquivos de outros frameworks/runtimes, que o carregamento via PyTorch não usa
+HF_IGNORE_PATTERNS = [
+    "*.h5", "*.msgpack", "*.onnx", "*.ot", "*.tflite", "*.mlmodel",
+    "onnx/*", "coreml/*", "openvino/*"
+]
+
+# Timeout (conexão, leitura) das consultas à API do Hugging Face
+HF_API_TIMEOUT = (5, 15)
+
+def _parse_install_date(value):
+    """Converte a data de instalação salva (ISO 8601) para datetime com timezone.
+
+    Returns:
+        datetime em UTC quando não houver timezone, ou None se ausente/inválida
+    """
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (TypeError, ValueError) as e:
+        logger.error(f"Erro ao converter data local '{value}': {str(e)}")
+        return None
+    # Se não tiver timezone, assumir UTC
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
 
 class ModelManager:
     """Gerenciador de modelos de IA e NLP para análise regulatória."""
@@ -53,56 +105,109 @@ class ModelManager:
     # Mapeamento reverso para permitir busca pelo nome completo do modelo
     NAME_TO_KEY = {info["name"]: key for key, info in MODELS.items()}
 
+    # Chave ou nome completo -> chave (chaves têm prioridade sobre nomes)
+    _KEY_OR_NAME = {**NAME_TO_KEY, **{key: key for key in MODELS}}
+
+    # Dependências verificadas uma única vez por processo
+    _deps_checked = False
+
     def __init__(self):
-        # Encontrar a raiz do projeto corretamente (4 níveis acima, assumindo que o arquivo está em src/intelligence/utils/)
-        self.base_dir = Path(__file__).resolve().parents[3]  # Ajuste para subir para a raiz do projeto
+        self.base_dir = PROJECT_ROOT
         self.models_dir = self.base_dir / "data" / "models"
         self.models_dir.mkdir(parents=True, exist_ok=True)
         self.version_file = self.models_dir / "model_status.json"
+        # Diretórios de modelos existentes, lidos uma única vez (evita um stat por modelo)
+        with os.scandir(self.models_dir) as entries:
+            self._installed_dirs = {entry.name for entry in entries if entry.is_dir()}
+        # Protege installed_versions e o arquivo de status em downloads paralelos
+        self._versions_lock = threading.Lock()
+        # Alterações em installed_versions ainda não gravadas (ver flush_versions)
+        self._versions_dirty = False
+        # Último commit (sha) visto no Hugging Face por modelo, reaproveitado no download
+        self._remote_revisions = {}
 
         os.environ["HF_HUB_DISABLE_SYMLINKS_WARNING"] = "true"  # Desabilitar aviso de symlinks
 
+        # Sessão HTTP reutilizada nas consultas à API do Hugging Face (uma única conexão TLS)
+        self._http = requests.Session()
+        self._http.mount("https://", HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.3, allowed_methods=["GET", "HEAD"])
+        ))
+        atexit.register(self._http.close)
+
         self.setup_logging()
         self.load_versions()
         self.ensure_dependencies()
 
+        # Garantir que alterações pendentes sejam gravadas ao final do processo
+        atexit.register(self.flush_versions)
+
     def setup_logging(self):
+        """Configura o log em arquivo do gerenciador uma única vez por processo."""
+        if logger.handlers:
+            return
+
         log_dir = self.base_dir / "logs"
         log_dir.mkdir(exist_ok=True)
-        
-        logging.basicConfig(
-            filename=log_dir / "model_manager.log",
-            level=logging.INFO,
-            format="%(asctime)s - %(levelname)s - %(message)s"
+
+        handler = RotatingFileHandler(
+            log_dir / "model_manager.log",
+            maxBytes=5 * 1024 * 1024,
+            backupCount=3,
+            encoding="utf-8"
         )
+        handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        # Manter as mensagens apenas no arquivo, sem alterar o logger raiz da aplicação
+        logger.propagate = False
 
     def load_versions(self):
         if self.version_file.exists():
-            with open(self.version_file, "r", encoding='utf-8') as f:
-                self.installed_versions = json.load(f)
+            raw = self.version_file.read_bytes()
+            self.installed_versions = orjson.loads(raw) if orjson is not None else json.loads(raw)
         else:
             self.installed_versions = {}
 
+        # Datas de instalação convertidas uma única vez (None se ausentes ou inválidas)
+        self._installed_dates = {
+            key: _parse_install_date(info.get("date"))
+            for key, info in self.installed_versions.items()
+        }
+
     def save_versions(self):
-        with open(self.version_file, "w", encoding='utf-8') as f:
-            json.dump(self.installed_versions, f, indent=4, ensure_ascii=False)
+        if orjson is not None:
+            raw = orjson.dumps(self.installed_versions, option=orjson.OPT_INDENT_2)
+        else:
+            raw = json.dumps(self.installed_versions, indent=4, ensure_ascii=False).encode('utf-8')
+        
+        # Gravar em arquivo temporário e substituir, para nunca deixar o status pela metade
+        tmp_file = self.version_file.with_name(self.version_file.name + ".tmp")
+        tmp_file.write_bytes(raw)
+        os.replace(tmp_file, self.version_file)
 
-    def ensure_dependencies(self):
-        """Garante que todas as dependências necessárias estão instaladas."""
-        try:
-            # Verificar se sentencepiece está instalado
-            import importlib.util
-            if importlib.util.find_spec("sentencepiece") is None:
-                print("Instalando biblioteca SentencePiece necessária para modelos T5...")
-                subprocess.check_call(
-                    ["pip", "install", "sentencepiece"],
-                    stdout=subprocess.DEVNULL
-                )
-                print("✅ SentencePiece instalado com sucesso!")
-            else:
-                print("SentencePiece já está instalado.")
-        except Exception as e:
-            print(f"⚠️ Aviso: Não foi possível verificar/instalar SentencePiece: {str(e)}")
+    def flush_versions(self):
+        """Grava o arquivo de status uma única vez, se houver alterações pendentes."""
+        with self._versions_lock:
+            if self._versions_dirty:
+                self.save_versions()
+                self._versions_dirty = False
+
+    @classmethod
+    def ensure_dependencies(cls):
+        """Verifica se as dependências necessárias para usar os modelos estão instaladas."""
+        if cls._deps_checked:
+            return
+        cls._deps_checked = True
+
+        # SentencePiece é declarado no environment.yml; não é instalado em tempo de execução.
+        # O download funciona sem ele, mas os modelos T5 não podem ser carregados depois
+        if importlib.util.find_spec("sentencepiece") is None:
+            message = "SentencePiece não está instalado; necessário para carregar modelos T5. Instale com: pip install sentencepiece"
+            logger.warning(message)
+            print(f"⚠️ Aviso: {message}")
 
     def get_model_path(self, model_name: str) -> Path:
         # Obter a chave do modelo, seja pelo identificador curto ou pelo nome completo
@@ -116,22 +221,16 @@ class ModelManager:
 
     def get_model_key(self, model_name: str) -> str:
         """Converte um nome de modelo (completo ou chave) para a chave apropriada."""
-        # Se o nome já for uma chave válida
-        if model_name in self.MODELS:
-            return model_name
-            
-        # Se o nome for um nome completo de modelo
-        if model_name in self.NAME_TO_KEY:
-            return self.NAME_TO_KEY[model_name]
-            
-        # Se não for encontrado
-        raise ValueError(f"Modelo '{model_name}' não reconhecido. Use --list para ver modelos disponíveis.")
+        try:
+            return self._KEY_OR_NAME[model_name]
+        except KeyError:
+            raise ValueError(f"Modelo '{model_name}' não reconhecido. Use --list para ver modelos disponíveis.") from None
 
     def is_model_installed(self, model_name: str) -> bool:
         try:
             model_key = self.get_model_key(model_name)
             model_path = self.get_model_path(model_key)
-            return model_path.exists() and model_key in self.installed_versions
+            return model_path.name in self._installed_dirs and model_key in self.installed_versions
         except ValueError:
             return False
 
@@ -153,9 +252,21 @@ class ModelManager:
             api_url = f"https://huggingface.co/api/models/{model_info['hub']}"
             
             try:
-                response = requests.get(api_url)
+                # Pedir apenas os campos usados, em vez dos metadados completos do repositório
+                response = self._http.get(
+                    api_url,
+                    params={"expand[]": ["lastModified", "sha"]},
+                    headers=self._conditional_headers(model_key),
+                    timeout=HF_API_TIMEOUT
+                )
+                if response.status_code == 304:
+                    # Metadados inalterados desde a instalação ou a última verificação
+                    return False
                 if response.status_code == 200:
                     model_data = response.json()
+                    # Guardar o commit atual para que um download em seguida baixe exatamente ele
+                    if model_data.get('sha'):
+                        self._remote_revisions[model_key] = model_data['sha']
                     # Extrair a data da última modificação
                     last_modified = model_data.get('lastModified')
                     
@@ -163,34 +274,21 @@ class ModelManager:
                         # Converter para objeto datetime com timezone (aware)
                         hf_update_time = datetime.fromisoformat(last_modified.replace('Z', '+00:00'))
                         
-                        # Pegar a data de instalação local
-                        local_date_str = self.installed_versions[model_key].get('date')
-                        
-                        # Garantir que a data local também tenha informações de timezone
-                        if local_date_str:
-                            try:
-                                # Tentar converter com timezone
-                                if local_date_str.endswith('Z'):
-                                    local_date_str = local_date_str.replace('Z', '+00:00')
-                                    
-                                if '+' in local_date_str or '-' in local_date_str and 'T' in local_date_str:
-                                    # Se já tiver timezone
-                                    local_date = datetime.fromisoformat(local_date_str)
-                                else:
-                                    # Se não tiver timezone, assumir UTC
-                                    local_date = datetime.fromisoformat(local_date_str).replace(tzinfo=timezone.utc)
-                                
-                                # Comparar datas (ambas com timezone)
-                                return hf_update_time > local_date
-                            except Exception as e:
-                                logging.error(f"Erro ao converter data local '{local_date_str}': {str(e)}")
-                                # Em caso de erro na conversão de data, assumir que precisa atualizar
-                                return True
-                        else:
-                            # Se não tiver data local, assumir que precisa atualizar
+                        # Data de instalação local, já convertida em load_versions
+                        local_date = self._installed_dates.get(model_key)
+                        if local_date is None:
+                            # Sem data local válida, assumir que precisa atualizar
                             return True
-            except Exception as e:
-                logging.error(f"Erro ao verificar atualizações para {model_name}: {str(e)}")
+                        
+                        # Comparar datas (ambas com timezone)
+                        has_updates = hf_update_time > local_date
+                        if not has_updates:
+                            # Guardar o ETag apenas quando a versão local está atualizada,
+                            # para que um 304 futuro signifique "sem atualizações"
+                            self._store_etag(model_key, response.headers.get("ETag"))
+                        return has_updates
+            except Exception:
+                logger.exception(f"Erro ao verificar atualizações para {model_name}")
                 print(f"⚠️ Não foi possível verificar atualizações online para {model_name}")
                 # Em caso de erro, assumir que não há atualizações
                 return False
@@ -201,6 +299,45 @@ class ModelManager:
             # Modelo não reconhecido
             return False
 
+    def _conditional_headers(self, model_key: str) -> dict:
+        """Monta os cabeçalhos de GET condicional a partir da instalação local."""
+        headers = {}
+        installed = self.installed_versions.get(model_key, {})
+        
+        etag = installed.get("etag")
+        if etag:
+            headers["If-None-Match"] = etag
+        
+        local_date = self._installed_dates.get(model_key)
+        if local_date is not None:
+            headers["If-Modified-Since"] = format_datetime(local_date.astimezone(timezone.utc), usegmt=True)
+        return headers
+
+    def _store_etag(self, model_key: str, etag):
+        """Registra o ETag dos metadados de um modelo instalado, se tiver mudado."""
+        if not etag:
+            return
+        with self._versions_lock:
+            installed = self.installed_versions.get(model_key)
+            if installed is not None and installed.get("etag") != etag:
+                installed["etag"] = etag
+                self._versions_dirty = True
+
+    def check_updates_batch(self, model_names) -> dict:
+        """Verifica atualizações de vários modelos em paralelo.
+        
+        Returns:
+            dict: Nome do modelo -> True se há atualizações, False caso contrário
+        """
+        model_names = list(model_names)
+        if not model_names:
+            return {}
+        
+        # As consultas são independentes e limitadas por rede; compartilham a sessão HTTP
+        with ThreadPoolExecutor(max_workers=min(16, len(model_names))) as executor:
+            results = executor.map(self.check_for_updates, model_names)
+            return dict(zip(model_names, results))
+
     def download_model(self, model_name: str, force_update=False):
         try:
             model_key = self.get_model_key(model_name)
@@ -225,18 +362,25 @@ class ModelManager:
             print(f"\nBaixando modelo: {model_info['name']}...")
 
         try:
+            revision = self._remote_revisions.get(model_key)
             if model_info["type"] == "huggingface":
-                self._download_huggingface(model_info, model_path)
+                self._download_huggingface(model_info, model_path, revision)
             else:
                 self._download_custom_model(model_info, model_path)
 
             # Armazenar a data com timezone para evitar problemas de comparação
-            self.installed_versions[model_key] = {
-                "version": model_info["version"],
-                "date": datetime.now(timezone.utc).isoformat(),
-                "path": str(model_path)
-            }
-            self.save_versions()
+            installed_at = datetime.now(timezone.utc)
+            with self._versions_lock:
+                self.installed_versions[model_key] = {
+                    "version": model_info["version"],
+                    "date": installed_at.isoformat(),
+                    "path": str(model_path)
+                }
+                if revision:
+                    self.installed_versions[model_key]["revision"] = revision
+                self._installed_dates[model_key] = installed_at
+                self._installed_dirs.add(model_path.name)
+                self._versions_dirty = True
             
             print(f"✅ Modelo {model_info['name']} instalado com sucesso!")
 
@@ -244,40 +388,32 @@ class ModelManager:
             print(f"❌ Erro ao baixar {model_info['name']}: {str(e)}")
             raise
 
-    def _download_huggingface(self, info, model_path):
-        """Baixa um modelo do Hugging Face."""
-        # Tratamento especial para modelos T5
-        if "t5" in info["name"].lower():
-            try:
-                # Garantir que as importações estejam disponíveis
-                import sentencepiece
-                from transformers import T5Model, T5Tokenizer
-                
-                print("Baixando tokenizer T5...")
-                tokenizer = T5Tokenizer.from_pretrained(info["hub"])
-                
-                print("Baixando modelo T5...")
-                model = T5Model.from_pretrained(info["hub"])
-            except ImportError:
-                print("SentencePiece não está disponível. Tentando alternativa...")
-                from transformers import AutoModelForSeq2SeqLM, AutoTokenizer as T5AutoTokenizer
-                tokenizer = T5AutoTokenizer.from_pretrained(info["hub"], use_fast=False)
-                model = AutoModelForSeq2SeqLM.from_pretrained(info["hub"])
-        else:
-            # Para modelos BERT e outros
-            # Reimportar aqui para garantir que as variáveis estejam no escopo
-            from transformers import AutoTokenizer as BertAutoTokenizer, AutoModel as BertAutoModel
-            print(f"Baixando tokenizer para {info['name']}...")
-            tokenizer = BertAutoTokenizer.from_pretrained(info["hub"])
-            
-            print(f"Baixando modelo para {info['name']}...")
-            model = BertAutoModel.from_pretrained(info["hub"])
+    def _download_huggingface(self, info, model_path, revision=None):
+        """Baixa os arquivos de um modelo do Hugging Face, sem carregá-lo em memória.
+
+        Args:
+            revision: Commit a baixar, quando já conhecido pela verificação de atualizações
+        """
+        from huggingface_hub import list_repo_files, snapshot_download
 
         model_path.mkdir(parents=True, exist_ok=True)
 
-        print(f"Salvando tokenizer e modelo em {model_path}...")
-        tokenizer.save_pretrained(model_path)
-        model.save_pretrained(model_path)
+        # Baixar só um formato de pesos: safetensors, quando existir, no lugar de .bin
+        ignore_patterns = list(HF_IGNORE_PATTERNS)
+        if any(name.endswith(".safetensors") for name in list_repo_files(info["hub"], revision=revision)):
+            ignore_patterns.append("*.bin")
+
+        # Os arquivos do repositório são copiados como estão; from_pretrained(model_path)
+        # carrega tokenizer e modelo deles, inclusive para T5 (spiece.model)
+        print(f"Baixando arquivos de {info['name']} para {model_path}...")
+        snapshot_download(
+            repo_id=info["hub"],
+            revision=revision,
+            local_dir=str(model_path),
+            local_dir_use_symlinks=False,
+            ignore_patterns=ignore_patterns,
+            max_workers=MAX_FILE_WORKERS
+        )
 
         print(f"✅ Modelo {info['name']} baixado e salvo em {model_path}")
 
@@ -289,6 +425,9 @@ class ModelManager:
         print(f"✅ Modelo {info['name']} baixado e salvo em {model_path}")
 
     def check_environment(self):
+        # torch é importado só aqui: os demais comandos da CLI não precisam dele
+        import torch
+
         return {
             "cuda_available": torch.cuda.is_available(),
             "gpu_memory": torch.cuda.get_device_properties(0).total_memory if torch.cuda.is_available() else None
@@ -326,21 +465,29 @@ def main():
     
     if args.check_updates:
         print("Verificando atualizações disponíveis:")
-        for key, info in manager.MODELS.items():
-            if manager.is_model_installed(key):
-                has_updates = manager.check_for_updates(key)
-                status = "Atualização disponível" if has_updates else "Atualizado"
-                print(f"  - {info['name']}: {status}")
+        installed = [key for key in manager.MODELS if manager.is_model_installed(key)]
+        for key, has_updates in manager.check_updates_batch(installed).items():
+            status = "Atualização disponível" if has_updates else "Atualizado"
+            print(f"  - {manager.MODELS[key]['name']}: {status}")
+        manager.flush_versions()
         return
     
     if args.download_all:
         print("Baixando todos os modelos disponíveis:")
-        for key in manager.MODELS:
-            try:
-                print(f"\n--- Processando modelo: {key} ---")
-                manager.download_model(key, force_update=args.update)
-            except Exception as e:
-                print(f"Erro ao baixar modelo {key}: {e}")
+        max_workers = min(MAX_PARALLEL_DOWNLOADS, len(manager.MODELS))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(manager.download_model, key, args.update): key
+                for key in manager.MODELS
+            }
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    future.result()
+                    print(f"\n--- Modelo processado: {key} ---")
+                except Exception as e:
+                    print(f"Erro ao baixar modelo {key}: {e}")
+        manager.flush_versions()
         return
     
     if args.model:
@@ -354,6 +501,7 @@ def main():
                 return
             
             manager.download_model(args.model, force_update=args.update)
+            manager.flush_versions()
         except ValueError as e:
             print(f"Erro: {e}")
         except Exception as e:
@@ -4,9 +4,9 @@ Gerenciador de palavras-chave para monitoramento de PLs.
 Permite adicionar, remover e atualizar palavras-chave por setor.
 """
 import os
-import pandas as pd
+import csv
 import json
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Tuple, Union, TYPE_CHECKING
 import logging
 
 # Configuração de logging
@@ -16,6 +16,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger("keyword_manager")
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Colunas dos arquivos CSV de palavras-chave
+KEYWORD_FIELDS = ['sector', 'keyword', 'type', 'enabled', 'description']
+
 class KeywordManager:
     """
     Classe para gerenciar palavras-chave por setor.
@@ -38,8 +44,16 @@ class KeywordManager:
         # Garante que o diretório existe
         os.makedirs(self.data_dir, exist_ok=True)
         
+        # Palavras-chave em memória por setor (nome normalizado), com o mtime do CSV
+        # de onde vieram; gravadas só quando mudam
+        self._keywords: Dict[str, Tuple[int, List[Dict[str, Any]]]] = {}
+        
         # Prepara dados padrão se não existirem
         self._initialize_default_keywords()
+        
+        # Carrega uma única vez os setores existentes
+        for sector in self.get_sectors():
+            self._get_rows(sector)
     
     def _initialize_default_keywords(self):
         """
@@ -100,9 +114,54 @@ class KeywordManager:
         Returns:
             Caminho do arquivo CSV
         """
-        # Normaliza o nome do setor (minúsculas, sem espaços)
-        sector = sector.lower().replace(" ", "_")
-        return os.path.join(self.data_dir, f"{sector}_keywords.csv")
+        return os.path.join(self.data_dir, f"{self._normalize_sector(sector)}_keywords.csv")
+    
+    @staticmethod
+    def _normalize_sector(sector: str) -> str:
+        """
+        Normaliza o nome do setor (minúsculas, sem espaços).
+        """
+        return sector.lower().replace(" ", "_")
+    
+    def _get_rows(self, sector: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Retorna as palavras-chave de um setor mantidas em memória, relendo o CSV
+        apenas quando ele foi alterado (por exemplo, por outra instância).
+        
+        Args:
+            sector: Nome do setor
+            
+        Returns:
+            Lista de dicionários com as palavras-chave, ou None se o setor não existir
+        """
+        key = self._normalize_sector(sector)
+        file_path = self._get_file_path(sector)
+        
+        try:
+            mtime = os.stat(file_path).st_mtime_ns
+        except FileNotFoundError:
+            self._keywords.pop(key, None)
+            return None
+        
+        cached = self._keywords.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        with open(file_path, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        
+        # O CSV guarda o status como texto ("True"/"False")
+        for row in rows:
+            row['enabled'] = str(row.get('enabled', '')).strip().lower() == 'true'
+        
+        self._keywords[key] = (mtime, rows)
+        return rows
+    
+    def clear_cache(self):
+        """
+        Descarta as palavras-chave em memória; a próxima leitura volta ao CSV.
+        """
+        self._keywords.clear()
     
     def get_sectors(self) -> List[str]:
         """
@@ -125,34 +184,37 @@ class KeywordManager:
             logger.error(f"Erro ao listar setores: {str(e)}")
             return []
     
-    def get_keywords(self, sector: str, enabled_only: bool = False) -> pd.DataFrame:
+    def get_keywords(self, sector: str, enabled_only: bool = False,
+                     as_dataframe: bool = False) -> Union[List[Dict[str, Any]], "pd.DataFrame"]:
         """
         Retorna as palavras-chave de um setor.
         
         Args:
             sector: Nome do setor
             enabled_only: Se True, retorna apenas palavras-chave ativas
+            as_dataframe: Se True, retorna um DataFrame do pandas em vez de uma lista
             
         Returns:
-            DataFrame com as palavras-chave
+            Lista de dicionários (ou DataFrame) com as palavras-chave
         """
-        file_path = self._get_file_path(sector)
-        
         try:
-            if os.path.exists(file_path):
-                df = pd.read_csv(file_path)
-                
-                # Aplica filtro se necessário
-                if enabled_only:
-                    df = df[df['enabled'] == True]
-                    
-                return df
-            else:
+            rows = self._get_rows(sector)
+            
+            if rows is None:
                 logger.warning(f"Arquivo de palavras-chave não encontrado para o setor: {sector}")
-                return pd.DataFrame(columns=['sector', 'keyword', 'type', 'enabled', 'description'])
+                rows = []
+            
+            # Cópias, para que o chamador não altere os dados em memória
+            rows = [dict(row) for row in rows if row['enabled'] or not enabled_only]
         except Exception as e:
             logger.error(f"Erro ao ler palavras-chave: {str(e)}")
-            return pd.DataFrame(columns=['sector', 'keyword', 'type', 'enabled', 'description'])
+            rows = []
+        
+        if as_dataframe:
+            # pandas só é importado quando um DataFrame é de fato pedido
+            import pandas as pd
+            return pd.DataFrame(rows, columns=KEYWORD_FIELDS)
+        return rows
     
     def _save_keywords(self, sector: str, keywords: List[Dict]) -> bool:
         """
@@ -168,14 +230,17 @@ class KeywordManager:
         file_path = self._get_file_path(sector)
         
         try:
-            # Prepara DataFrame
-            df = pd.DataFrame(keywords)
-            
             # Adiciona coluna de setor
-            df['sector'] = sector
+            rows = [{**keyword, 'sector': sector} for keyword in keywords]
             
             # Salva no arquivo
-            df.to_csv(file_path, index=False)
+            with open(file_path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=KEYWORD_FIELDS, extrasaction='ignore')
+                writer.writeheader()
+                writer.writerows(rows)
+            
+            # Atualiza a cópia em memória somente após gravar com sucesso
+            self._keywords[self._normalize_sector(sector)] = (os.stat(file_path).st_mtime_ns, rows)
             logger.info(f"Palavras-chave salvas com sucesso para o setor: {sector}")
             return True
         except Exception as e:
@@ -199,10 +264,10 @@ class KeywordManager:
         """
         try:
             # Obtém palavras-chave existentes
-            df = self.get_keywords(sector)
+            rows = self._get_rows(sector) or []
             
             # Verifica se a palavra-chave já existe
-            if not df.empty and keyword in df['keyword'].values:
+            if any(row['keyword'] == keyword for row in rows):
                 logger.warning(f"Palavra-chave '{keyword}' já existe para o setor: {sector}")
                 return False
             
@@ -215,12 +280,9 @@ class KeywordManager:
                 'description': description
             }
             
-            # Adiciona ao DataFrame
-            new_df = pd.concat([df, pd.DataFrame([new_keyword])], ignore_index=True)
-            
-            # Salva no arquivo
-            file_path = self._get_file_path(sector)
-            new_df.to_csv(file_path, index=False)
+            # Adiciona e salva no arquivo
+            if not self._save_keywords(sector, rows + [new_keyword]):
+                return False
             
             logger.info(f"Palavra-chave '{keyword}' adicionada ao setor: {sector}")
             return True
@@ -241,19 +303,16 @@ class KeywordManager:
         """
         try:
             # Obtém palavras-chave existentes
-            df = self.get_keywords(sector)
+            rows = self._get_rows(sector) or []
             
             # Verifica se a palavra-chave existe
-            if df.empty or keyword not in df['keyword'].values:
+            if not any(row['keyword'] == keyword for row in rows):
                 logger.warning(f"Palavra-chave '{keyword}' não encontrada para o setor: {sector}")
                 return False
             
-            # Remove a palavra-chave
-            new_df = df[df['keyword'] != keyword]
-            
-            # Salva no arquivo
-            file_path = self._get_file_path(sector)
-            new_df.to_csv(file_path, index=False)
+            # Remove a palavra-chave e salva no arquivo
+            if not self._save_keywords(sector, [row for row in rows if row['keyword'] != keyword]):
+                return False
             
             logger.info(f"Palavra-chave '{keyword}' removida do setor: {sector}")
             return True
@@ -275,19 +334,20 @@ class KeywordManager:
         """
         try:
             # Obtém palavras-chave existentes
-            df = self.get_keywords(sector)
+            rows = self._get_rows(sector) or []
             
             # Verifica se a palavra-chave existe
-            if df.empty or keyword not in df['keyword'].values:
+            if not any(row['keyword'] == keyword for row in rows):
                 logger.warning(f"Palavra-chave '{keyword}' não encontrada para o setor: {sector}")
                 return False
             
-            # Atualiza o status
-            df.loc[df['keyword'] == keyword, 'enabled'] = enabled
-            
-            # Salva no arquivo
-            file_path = self._get_file_path(sector)
-            df.to_csv(file_path, index=False)
+            # Atualiza o status e salva no arquivo
+            new_rows = [
+                {**row, 'enabled': enabled} if row['keyword'] == keyword else row
+                for row in rows
+            ]
+            if not self._save_keywords(sector, new_rows):
+                return False
             
             status_str = "ativada" if enabled else "desativada"
             logger.info(f"Palavra-chave '{keyword}' {status_str} no setor: {sector}")
@@ -309,24 +369,23 @@ class KeywordManager:
         """
         try:
             # Obtém palavras-chave existentes
-            df = self.get_keywords(sector)
+            rows = self._get_rows(sector) or []
             
-            # Verifica se a palavra-chave existe
-            if df.empty or keyword not in df['keyword'].values:
+            # Obtém status atual (verificando se a palavra-chave existe)
+            current_status = next((row['enabled'] for row in rows if row['keyword'] == keyword), None)
+            if current_status is None:
                 logger.warning(f"Palavra-chave '{keyword}' não encontrada para o setor: {sector}")
                 return False
             
-            # Obtém status atual
-            current_status = df.loc[df['keyword'] == keyword, 'enabled'].iloc[0]
-            
-            # Inverte o status
-            df.loc[df['keyword'] == keyword, 'enabled'] = not current_status
-            
-            # Salva no arquivo
-            file_path = self._get_file_path(sector)
-            df.to_csv(file_path, index=False)
-            
+            # Inverte o status e salva no arquivo
             new_status = not current_status
+            new_rows = [
+                {**row, 'enabled': new_status} if row['keyword'] == keyword else row
+                for row in rows
+            ]
+            if not self._save_keywords(sector, new_rows):
+                return False
+            
             status_str = "ativada" if new_status else "desativada"
             logger.info(f"Palavra-chave '{keyword}' {status_str} no setor: {sector}")
             return True
@@ -347,27 +406,14 @@ class KeywordManager:
         result = {"term": [], "reference": []}
         
         try:
-            if sector:
-                # Exporta apenas para um setor
-                df = self.get_keywords(sector, enabled_only=True)
-                
-                if not df.empty:
-                    for keyword_type in ["term", "reference"]:
-                        type_df = df[df['type'] == keyword_type]
-                        if not type_df.empty:
-                            result[keyword_type] = type_df['keyword'].tolist()
-            else:
-                # Exporta para todos os setores
-                sectors = self.get_sectors()
-                for sector in sectors:
-                    df = self.get_keywords(sector, enabled_only=True)
-                    
-                    if not df.empty:
-                        for keyword_type in ["term", "reference"]:
-                            type_df = df[df['type'] == keyword_type]
-                            if not type_df.empty:
-                                result[keyword_type].extend(type_df['keyword'].tolist())
-                
+            # Exporta apenas para um setor ou para todos os setores
+            sectors = [sector] if sector else self.get_sectors()
+            for current_sector in sectors:
+                for row in self._get_rows(current_sector) or []:
+                    if row['enabled'] and row['type'] in result:
+                        result[row['type']].append(row['keyword'])
+            
+            if not sector:
                 # Remove duplicatas
                 result["term"] = list(set(result["term"]))
                 result["reference"] = list(set(result["reference"]))
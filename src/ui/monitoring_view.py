@@ -88,7 +88,7 @@ def _render_search_config():
     st.session_state.monitor_sector = selected_sector
     
     # Obtém palavras-chave do setor selecionado
-    keywords_df = keyword_manager.get_keywords(sector=selected_sector)
+    keywords_df = keyword_manager.get_keywords(sector=selected_sector, as_dataframe=True)
     
     # Mostra as palavras-chave ativas
     st.write("#### Palavras-chave")
@@ -495,7 +495,7 @@ def _render_keyword_manager():
                     st.error("Erro ao adicionar palavra-chave. Talvez ela já exista.")
     
     with tab2:
-        keywords_df = keyword_manager.get_keywords(sector=st.session_state.monitor_sector, enabled_only=False)
+        keywords_df = keyword_manager.get_keywords(sector=st.session_state.monitor_sector, enabled_only=False, as_dataframe=True)
         
         if not keywords_df.empty:
             # Agrupa por tipo
@@ -0,0 +1,44 @@
+"""
+Testes do cache de respostas do cliente base da API do Senado.
+"""
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("xmltodict")
+# Importado pelo __init__ do pacote senado (fachada)
+pytest.importorskip("pandas")
+
+from src.intelligence.collectors.senado import api_base
+from src.intelligence.collectors.senado.api_base import SenadoAPIBase
+
+
+def test_cache_hit_is_not_affected_by_mutating_a_previous_result(tmp_path):
+    api = SenadoAPIBase(cache_dir=str(tmp_path))
+    params = {"sigla": "PL", "numero": "1"}
+    api._save_to_cache("materia", params, {"Materia": {"Autores": ["Sen. A"]}})
+
+    first = api._load_from_cache("materia", params)
+    first["Materia"]["Autores"].append("Sen. B")
+    first["extra"] = True
+
+    assert api._load_from_cache("materia", params) == {"Materia": {"Autores": ["Sen. A"]}}
+
+
+def test_cache_key_distinguishes_separators_inside_values(tmp_path):
+    api = SenadoAPIBase(cache_dir=str(tmp_path))
+
+    assert (api._get_cache_key("materia", {"a": "1&b=2"})
+            != api._get_cache_key("materia", {"a": "1", "b": "2"}))
+
+
+def test_memory_cache_hit_skips_decompression(tmp_path, monkeypatch):
+    api = SenadoAPIBase(cache_dir=str(tmp_path))
+    params = {"sigla": "PL", "numero": "1"}
+    api._save_to_cache("materia", params, {"Materia": {"Codigo": "1"}})
+
+    def fail(*args, **kwargs):
+        raise AssertionError("zlib.decompress chamado em acerto do cache em memória")
+
+    monkeypatch.setattr(api_base.zlib, "decompress", fail)
+
+    assert api._load_from_cache("materia", params) == {"Materia": {"Codigo": "1"}}
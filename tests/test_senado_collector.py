@@ -0,0 +1,42 @@
+"""
+Testes do coletor de PLs baseado em CSV.
+"""
+import csv
+
+from src.intelligence.collectors.senado_collector import SenadoCollector
+
+
+def test_add_pl_respects_existing_column_order(tmp_path):
+    csv_path = tmp_path / "pls.csv"
+    fieldnames = ["Sigla", "Numero", "Ano", "Título", "Data", "Autor", "Status", "URL", "Palavras-chave"]
+    with open(csv_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerow({
+            "Sigla": "PL", "Numero": "1", "Ano": "2020", "Título": "Existente",
+            "Data": "2020-01-01", "Autor": "Sen. A", "Status": "S", "URL": "", "Palavras-chave": ""
+        })
+
+    collector = SenadoCollector(csv_path=str(csv_path))
+    assert collector.add_pl_to_csv("PL", "2", "2021", {"Autor": "ZZ", "Data": "2021-05-05"})
+
+    reloaded = SenadoCollector(csv_path=str(csv_path))
+    assert reloaded.get_pl_by_id("PL", "2", "2021")["Autor"] == "ZZ"
+    assert reloaded.get_pl_by_id("PL", "2", "2021")["Data"] == "2021-05-05"
+    assert reloaded.get_pl_by_id("PL", "1", "2020")["Autor"] == "Sen. A"
+
+
+def test_add_pl_to_csv_without_trailing_newline(tmp_path):
+    csv_path = tmp_path / "pls.csv"
+    csv_path.write_text(
+        "Sigla,Numero,Ano,Título,Autor,Data,Status,URL,Palavras-chave\n"
+        "PL,1,2020,Existente,Sen. A,2020-01-01,S,,",
+        encoding="utf-8"
+    )
+
+    collector = SenadoCollector(csv_path=str(csv_path))
+    assert collector.add_pl_to_csv("PL", "2", "2021", {"Autor": "Sen. B"})
+
+    reloaded = SenadoCollector(csv_path=str(csv_path))
+    assert reloaded.get_pl_by_id("PL", "1", "2020")["Palavras-chave"] == ""
+    assert reloaded.get_pl_by_id("PL", "2", "2021")["Autor"] == "Sen. B"
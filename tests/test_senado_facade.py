@@ -0,0 +1,35 @@
+"""
+Testes da fachada de coleta de dados do Senado.
+"""
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("xmltodict")
+pytest.importorskip("pandas")
+
+from src.intelligence.collectors.senado.senado_facade import SenadoAPI
+
+
+@pytest.mark.parametrize("pl_details", [None, {"ID": "PL 1/2020"}])
+def test_additional_details_do_not_wait_for_unused_committee_votes(tmp_path, monkeypatch, pl_details):
+    api = SenadoAPI(cache_dir=str(tmp_path))
+    release = threading.Event()
+
+    def slow_committee_votes(sigla, numero, ano):
+        release.wait(5)
+        return []
+
+    monkeypatch.setattr(api.votacao, "get_votacoes_comissao", slow_committee_votes)
+    monkeypatch.setattr(api.materias, "get_pl_by_id", lambda sigla, numero, ano: pl_details)
+
+    start = time.monotonic()
+    try:
+        result = api.get_additional_pl_details("PL", "1", "2020")
+    finally:
+        release.set()
+
+    assert time.monotonic() - start < 1
+    assert result == (pl_details or {})